@@ -22,6 +22,8 @@ PAGE = {
     "label": "Notificações",
     "sidebar": False,
     "order": 50,
+    # precisa existir desde o início para receber as entradas do barramento
+    "lazy": False,
 }
 
 # ------------------------- Item da lista -------------------------
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import importlib
 import json
+import os
 import pkgutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Union
 
@@ -23,13 +25,15 @@ def _normalize_route(route: str) -> str:
 #  Data Model
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageSpec:
     route: str
     label: str
     sidebar: bool
     order: int
     factory: Callable[..., QWidget]
+    # lazy: widget criado só na 1ª navegação para a rota (False = na inicialização)
+    lazy: bool = True
 
     def is_valid(self) -> bool:
         return bool(self.route and callable(self.factory))
@@ -50,7 +54,7 @@ def _normalize(specs: List[PageSpec]) -> List[PageSpec]:
             continue
         by_route[spec.route] = spec  # último vence
     out = list(by_route.values())
-    out.sort(key=lambda s: (getattr(s, "order", 1000), s.label or s.route))
+    out.sort(key=lambda s: (s.order, s.label or s.route))
     return out
 
 
@@ -83,6 +87,7 @@ def _discover_from_module(module) -> List[PageSpec]:
     label = route
     sidebar = True
     order = 1000
+    lazy = True
 
     # 1) se houver PAGE dict, usa-o
     meta = getattr(module, "PAGE", None)
@@ -91,17 +96,20 @@ def _discover_from_module(module) -> List[PageSpec]:
         label = meta.get("label", label)
         sidebar = meta.get("sidebar", sidebar)
         order = meta.get("order", order)
+        lazy = meta.get("lazy", lazy)
     else:
         # 2) senão, tenta as constantes
         route = getattr(module, "ROUTE", getattr(module, "route", route))
         label = getattr(module, "LABEL", getattr(module, "label", label))
         sidebar = getattr(module, "SIDEBAR", getattr(module, "sidebar", sidebar))
         order = getattr(module, "ORDER", getattr(module, "order", order))
+        lazy = getattr(module, "LAZY", lazy)
 
     route = _normalize_route(route)
 
     try:
-        specs.append(PageSpec(route=route, label=label, sidebar=bool(sidebar), order=int(order), factory=factory))
+        specs.append(PageSpec(route=route, label=label, sidebar=bool(sidebar), order=int(order), factory=factory,
+                              lazy=bool(lazy)))
     except Exception as e:  # noqa: BLE001
         print(f"[WARN] Erro ao extrair PageSpec de módulo {getattr(module, '__name__', module)}: {e}")
 
@@ -182,15 +190,25 @@ def _coerce_manifest_items(data: JsonLike) -> List[dict]:
     return []
 
 
-def load_from_manifest(manifest_path: Path) -> List[PageSpec]:
+@lru_cache(maxsize=8)
+def _read_manifest_json(path: str, mtime_ns: int) -> JsonLike:
+    # decodificado uma vez por (caminho, mtime): reabrir o app no mesmo processo não relê
+    with open(path, "rb") as f:
+        return json.loads(f.read().decode("utf-8"))
+
+
+def load_from_manifest(manifest_path: Path, *, missing_ok: bool = False) -> List[PageSpec]:
     specs: List[PageSpec] = []
-    if not manifest_path.exists():
-        print(f"[INFO] Manifesto não encontrado: {manifest_path}")
+    # um único stat decide existência e a chave do cache (sem exists() + open)
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
+        if not missing_ok:
+            print(f"[INFO] Manifesto não encontrado: {manifest_path}")
         return specs
 
     try:
-        raw = manifest_path.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        data = _read_manifest_json(str(manifest_path), st.st_mtime_ns)
     except Exception as e:  # noqa: BLE001
         print(f"[ERRO] Falha ao ler manifesto de páginas: {e}")
         return specs
@@ -203,6 +221,7 @@ def load_from_manifest(manifest_path: Path) -> List[PageSpec]:
             label = item.get("label", route or None)
             sidebar = bool(item.get("sidebar", True))
             order = int(item.get("order", 1000))
+            lazy = bool(item.get("lazy", True))
 
             factory: Callable[..., QWidget] | None = None
 
@@ -258,7 +277,7 @@ def load_from_manifest(manifest_path: Path) -> List[PageSpec]:
             if not label:
                 label = route
 
-            specs.append(PageSpec(route=route, label=label, sidebar=sidebar, order=order, factory=factory))
+            specs.append(PageSpec(route=route, label=label, sidebar=sidebar, order=order, factory=factory, lazy=lazy))
 
         except Exception as e:  # noqa: BLE001
             print(f"[WARN] Falha ao processar item do manifesto {item}: {e}")
@@ -295,7 +314,7 @@ def discover_pages(package: str = "app.pages") -> List[PageSpec]:
 # ============================================================
 
 def get_all_pages(manifest_path: Optional[Path] = None) -> List[PageSpec]:
-    manifest_specs = load_from_manifest(manifest_path) if manifest_path and manifest_path.exists() else []
+    manifest_specs = load_from_manifest(manifest_path, missing_ok=True) if manifest_path else []
     auto_specs = discover_pages()
     by_route = {s.route: s for s in auto_specs}
     for s in manifest_specs:
@@ -232,7 +232,8 @@ class SettingsPage(QWidget):
 
         # >>> NOVO: se alguém criar/apagar/renomear/editar via ThemeService,
         # a lista reflete imediatamente (sem reiniciar app).
-        self.tm.themesChanged.connect(lambda _names: self._reload())
+        # O sinal já carrega a lista atual; reaproveita sem nova varredura.
+        self.tm.themesChanged.connect(lambda names: self._reload_from(names))
 
     # ---------- helpers (frameless dialogs) ----------
     def _prompt_text(self, title: str, label: str, initial: str = "") -> tuple[str, bool]:
@@ -334,7 +335,11 @@ class SettingsPage(QWidget):
     # ---------- data/load ----------
     def _reload(self, select: str | None = None):
         """Recarrega SEM cache, usando o ThemeService como fonte de verdade."""
-        names = sorted(self.tm.available())
+        self._reload_from(self.tm.available(), select=select)
+
+    def _reload_from(self, names: list[str], select: str | None = None):
+        """Preenche o combo a partir de uma lista já varrida (sem tocar no FS)."""
+        names = sorted(names)
         current = select or self.tm.current() or self.tm.load_selected_from_settings()
 
         self.combo.blockSignals(True)
@@ -360,12 +365,15 @@ class SettingsPage(QWidget):
             return
 
         name = _slugify(raw)
-        if name in (self._scan_fs_names() or []):
+        # uma única varredura por ação; a lista é reaproveitada nos reloads
+        names = self._scan_fs_names()
+        if name in names:
             self._info("Tema existente", f"Já existe um tema chamado '{name}'.")
             return
+        names.append(name)
 
         # cria tema neutro e salva via serviço (façade)
-        initial = {"vars": dict(NEUTRAL_VARS)}
+        initial = {"vars": NEUTRAL_VARS.copy()}
         self.tm.save_theme(name, initial)
 
         # abre editor; ao aceitar, salva alterações e aplica
@@ -375,12 +383,12 @@ class SettingsPage(QWidget):
             except AttributeError:
                 new_data = {"vars": getattr(dlg, "props", {})}
             self.tm.save_theme(name, new_data)
-            self._reload(select=name)
+            self._reload_from(names, select=name)
             self.tm.apply(name, animate=True, persist=True)
 
         self._open_theme_editor(name, initial, on_accept=_accepted)
         # lista deve refletir imediatamente o novo arquivo
-        self._reload(select=name)
+        self._reload_from(names, select=name)
 
     def _edit_theme(self):
         name = self.combo.currentText().strip()
@@ -419,16 +427,16 @@ class SettingsPage(QWidget):
 
         self.tm.delete_theme(name)
 
-        # recarrega do FS e aplica o padrão (ou primeiro disponível)
-        names_after = self._scan_fs_names()
+        # reaproveita a varredura inicial e aplica o padrão (ou primeiro disponível)
+        names_after = [n for n in names if n != name]
         if not names_after:
             # segurança: restaura um tema neutro como padrão
             fallback = "default"
-            self.tm.save_theme(fallback, {"vars": dict(NEUTRAL_VARS)})
+            self.tm.save_theme(fallback, {"vars": NEUTRAL_VARS.copy()})
             names_after = [fallback]
 
         apply_name = default_name if default_name in names_after else names_after[0]
-        self._reload(select=apply_name)
+        self._reload_from(names_after, select=apply_name)
         self.tm.apply(apply_name, animate=True, persist=True)
 
     # ---------- factory ----------
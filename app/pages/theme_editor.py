@@ -1,7 +1,12 @@
 # ui/pages/theme_editor.py
 
 from __future__ import annotations
-from typing import Dict, Optional, Tuple
+from collections import ChainMap
+from functools import lru_cache
+import hashlib
+import re
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
@@ -9,16 +14,16 @@ from PySide6.QtWidgets import (
     QLabel, QFrame, QGridLayout, QLineEdit, QListWidget, QScrollArea,
     QSizePolicy
 )
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QPainter
 
 from ui.core.frameless_window import FramelessDialog
 from ui.widgets.titlebar import TitleBar
 
-from ui.services.qss_renderer import load_base_qss, render_qss_from_base
+from ui.services.qss_renderer import load_base_qss, render_qss_from_base, normalize_vars
 import app.settings as cfg
 
-# === Tokens padrão ===
-DEFAULT_VARS: Dict[str, str] = {
+# === Tokens padrão (somente leitura) ===
+DEFAULT_VARS: Mapping[str, str] = MappingProxyType({
     "bg_start": "#2f2f2f",
     "bg_end": "#3f3f3f",
     "bg": "#2f2f2f",
@@ -36,7 +41,10 @@ DEFAULT_VARS: Dict[str, str] = {
     "slider": "#e11717",
     "cond_selected": "#505050",
     "window_bg": "#2f2f2f",
-}
+})
+
+# vars das quais dependem os tokens derivados em _derive_tokens
+_DERIVED_INPUTS: Tuple[str, ...] = ("bg", "bg_start", "bg_end", "surface", "accent", "slider")
 
 GROUPS: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
     ("Fundo", (
@@ -72,30 +80,225 @@ GROUPS: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
     )),
 )
 
+# Debounce da preview: confirmação de cor vs. arrasto contínuo no QColorDialog
+QSS_DEBOUNCE_MS = 16
+QSS_DEBOUNCE_DRAG_MS = 60
+
 def _darken_hex(hex_color: str, factor: float) -> str:
-    h = hex_color.lstrip("#")
-    r = int(h[0:2], 16); g = int(h[2:4], 16); b = int(h[4:6], 16)
-    clamp = lambda x: max(0, min(255, int(round(x*factor))))
-    return f"#{clamp(r):02X}{clamp(g):02X}{clamp(b):02X}"
+    # um único int() do RRGGBB e canais por shift (sem 3 fatias + 3 parses)
+    v = int(hex_color.lstrip("#")[:6], 16)
+    r = min(255, round((v >> 16) * factor))
+    g = min(255, round(((v >> 8) & 0xFF) * factor))
+    b = min(255, round((v & 0xFF) * factor))
+    return f"#{(r << 16) | (g << 8) | b:06X}"
+
+def _rgba(hex_color: str, alpha: float) -> str:
+    v = int(hex_color.lstrip("#")[:6], 16)
+    a = max(0.0, min(1.0, alpha))
+    return f"rgba({v >> 16},{(v >> 8) & 0xFF},{v & 0xFF},{a:.3f})"
+
+_PREVIEW_SCOPE = "ThemePreview"
 
-def _scope_qss(qss: str, scope_id: str = "ThemePreview") -> str:
+# Linha com '{' que não seja comentário/at-rule: captura o seletor (sem espaços das pontas)
+_RX_SCOPE_SELECTOR = re.compile(r"^(?![^\S\n]*(?:/\*|@))[^\S\n]*([^\n{]*?)[^\S\n]*\{", re.M)
+
+def _scope_qss(qss: str, scope_id: str = _PREVIEW_SCOPE) -> str:
     """Prefixa cada seletor com #ThemePreview para isolar o estilo no preview."""
-    out = []
-    for line in qss.splitlines():
-        s = line.strip()
-        if s.startswith(("/*","@")) or "{" not in line:
-            out.append(line); continue
-        left, right = line.split("{", 1)
-        out.append(f"#{scope_id} {left.strip()}{{{right}")
-    return "\n".join(out)
+    return _RX_SCOPE_SELECTOR.sub(f"#{scope_id} \\g<1>{{", qss)
+
+def _outer_panel_rule(surface: str) -> str:
+    return f"\n#{_PREVIEW_SCOPE} QFrame#OuterPanel {{ background: {surface}; }}"
+
+# Placeholders do qss_renderer numa alternação só: {{token}} | ${token} | {token} | {#hex}
+_RX_PLACEHOLDER = re.compile(
+    r"\{\{([A-Za-z0-9_\-]+)\}\}|\$\{([A-Za-z0-9_\-]+)\}|\{([A-Za-z0-9_\-]+)\}"
+    r"|\{(#(?:[A-Fa-f0-9]{3}|[A-Fa-f0-9]{6}|[A-Fa-f0-9]{8}))\}"
+)
+
+# '{palavra' logo antes de um token: o valor substituído pode formar um novo {token}
+_RX_WRAP_LEFT = re.compile(r"\{[A-Za-z0-9_\-]*$")
+
+PreviewTemplate = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+def _strip_segments(segs: list, *, leading: bool) -> list:
+    """strip() de uma sequência [literal | (chave,)] só nas pontas literais."""
+    idx = 0 if leading else -1
+    while segs and isinstance(segs[idx], str):
+        t = segs[idx].lstrip() if leading else segs[idx].rstrip()
+        if t:
+            segs[idx] = t
+            break
+        segs.pop(idx)
+    return segs
+
+@lru_cache(maxsize=4)
+def _preview_template(base_qss: str) -> Optional[PreviewTemplate]:
+    """
+    Compila o base.qss em (literais, chaves) numa única varredura: na mesma passada
+    troca placeholders por posições de token e prefixa cada seletor com
+    #ThemePreview. Uma troca de cor vira só o preenchimento dessas posições.
+    Equivale a render_qss_from_base + _scope_qss. Retorna None se houver token
+    envolto em chaves (ex.: '{{{bg}}}', '{a{bg}}'), cujo resultado no renderer
+    depende do valor; nesse caso usa-se o caminho em duas passadas.
+    """
+    literals: list[str] = []
+    keys: list[str] = []
+    buf: list[str] = []
+
+    def emit(segs) -> None:
+        for seg in segs:
+            if isinstance(seg, str):
+                buf.append(seg)
+            else:
+                literals.append("".join(buf)); buf.clear(); keys.append(seg[0])
+
+    for i, line in enumerate(base_qss.split("\n")):
+        if i:
+            buf.append("\n")
+        segs: list = []
+        pos = 0
+        for m in _RX_PLACEHOLDER.finditer(line):
+            if m.start() > pos:
+                segs.append(line[pos:m.start()])
+            hex_lit = m.group(4)
+            if not hex_lit and _RX_WRAP_LEFT.search(line, 0, m.start()):
+                return None
+            segs.append(hex_lit if hex_lit else (m.group(1) or m.group(2) or m.group(3),))
+            pos = m.end()
+        if pos < len(line):
+            segs.append(line[pos:])
+
+        # 1º '{' de bloco = 1º '{' fora de placeholder
+        brace = next((j for j, seg in enumerate(segs) if isinstance(seg, str) and "{" in seg), None)
+        if brace is None or line.lstrip().startswith(("/*", "@")):
+            emit(segs)
+            continue
+        left, right = segs[brace].split("{", 1)
+        emit([f"#{_PREVIEW_SCOPE} "])
+        emit(_strip_segments(_strip_segments(segs[:brace] + [left], leading=True), leading=False))
+        emit(["{", right] + segs[brace + 1:])
+
+    head, tail = _outer_panel_rule("\0").split("\0")
+    emit([head, ("surface",), tail])
+    literals.append("".join(buf))
+    return tuple(literals), tuple(keys)
+
+@lru_cache(maxsize=64)
+def _render_scoped(base_qss: str, token_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Renderiza + escopa o QSS da preview; memoizado pelo estado dos tokens."""
+    tpl = _preview_template(base_qss)
+    if tpl is None:
+        tokens = dict(token_items)
+        scoped = _scope_qss(render_qss_from_base(base_qss, tokens))
+        return scoped + _outer_panel_rule(tokens.get("surface", DEFAULT_VARS["surface"]))
+
+    literals, keys = tpl
+    # mesmos aliases/derivados (content_bg etc.) e fallback do render_qss_from_base
+    vars_ = normalize_vars(dict(token_items))
+    out = [""] * (len(literals) + len(keys))
+    out[0::2] = literals
+    out[1::2] = [str(vars_.get(k, "transparent")) for k in keys]
+    return "".join(out)
+
+def _base_qss_sig(path: str) -> bytes:
+    """Assinatura curta do conteúdo do base.qss (b"" se não existir)."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).digest()
+    except OSError:
+        return b""
+
+@lru_cache(maxsize=4)
+def _load_base_qss_by_sig(path: str, sig: bytes) -> str:
+    return load_base_qss(path)
+
+def _cached_base_qss(path: str) -> str:
+    """
+    base.qss compartilhado entre os diálogos. A chave inclui o hash do conteúdo:
+    se o arquivo for editado (loop de dev) o cache invalida sozinho, e enquanto não
+    mudar o mesmo objeto str é devolvido (mantém os caches de render quentes).
+    """
+    return _load_base_qss_by_sig(path, _base_qss_sig(path))
+
+# QSS escopado dos tokens padrão, compartilhado entre diálogos: (base_qss, qss)
+_DEFAULT_SCOPED: Optional[Tuple[str, str]] = None
+
+
+# === Chrome do editor (painel esquerdo) — templates para str.format_map ===
+# Contorno e fundo do painel
+_PANE_TPL = """
+QFrame#EditorPane {{
+    background: {surface};
+    border: 1px solid {border};
+    border-radius: 10px;
+}}
+"""
+
+# Fundo do conteúdo = surface; filhos transparentes herdam o fundo
+_LEFT_TPL = """
+QWidget#EditorLeft {{
+    background: {surface};
+    color: {text};
+}}
+QWidget#EditorLeft * {{
+    color: {text};
+    background: transparent;
+}}
+QFrame#groupBox {{
+    background: transparent;
+    border: none;
+}}
+QWidget#EditorLeft QPushButton[swatch="true"] {{
+    border: 1px solid rgba(0,0,0,.35);
+    border-radius: {swatch_radius}px;
+}}
+"""
+
+# Scrollbar fina + transparências no scroll/viewport
+_SCROLL_TPL = """
+QScrollArea#EditorScroll {{
+    background: transparent;
+}}
+QScrollArea#EditorScroll > QWidget {{
+    background: transparent;
+}}
+QScrollArea#EditorScroll > QWidget > QWidget {{
+    background: transparent;
+}}
+QScrollBar:vertical {{
+    width: 6px;
+    margin: 0;
+    background: transparent;
+}}
+QScrollBar::handle:vertical {{
+    min-height: 20px;
+    border-radius: 3px;
+    background: {slider};
+    border: 1px solid {border};
+}}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; }}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: transparent; }}
+"""
+
+_CHROME_TPLS: Tuple[str, str, str] = (_PANE_TPL, _LEFT_TPL, _SCROLL_TPL)
+
+
+# diâmetro do SwatchButton (o raio entra na regra [swatch="true"] do _LEFT_TPL)
+SWATCH_SIZE = 18
 
 
 class SwatchButton(QPushButton):
-    """Amostra de cor em formato CÍRCULO; clique abre QColorDialog."""
+    """
+    Amostra de cor em formato CÍRCULO; clique abre QColorDialog.
+    O contorno vem de uma única regra QSS do editor (propriedade swatch=true);
+    a cor é pintada no paintEvent, sem setStyleSheet por instância
+    (palette() no QSS lê o palette da aplicação, não o do widget).
+    """
     def __init__(self, key: str, color_hex: str, on_pick, parent=None):
         super().__init__(parent)
         self.key = key; self._on_pick = on_pick
-        self._size = 18  # diâmetro
+        self._size = SWATCH_SIZE  # diâmetro
+        self.setProperty("swatch", True)
         self.setFixedSize(self._size, self._size)
         self.setCursor(Qt.PointingHandCursor)
         sp = self.sizePolicy()
@@ -105,18 +308,38 @@ class SwatchButton(QPushButton):
         self.clicked.connect(self._choose)
 
     def _apply(self, color_hex: str):
-        radius = int(self._size/2)
-        self.setStyleSheet(
-            f"QPushButton{{background:{color_hex};"
-            f"border:1px solid rgba(0,0,0,.35);border-radius:{radius}px;}}"
-        )
+        self._color = QColor(color_hex)
         self.setToolTip(f"{self.key}: {color_hex}")
+        self.update()
+
+    def paintEvent(self, e):
+        # preenche o círculo com a cor; o contorno (QSS) é desenhado por cima
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self._color)
+        p.drawEllipse(self.rect().adjusted(1, 1, -1, -1))
+        p.end()
+        super().paintEvent(e)
 
     def _choose(self):
-        initial = QColor(self.toolTip().split(":")[-1].strip())
-        col = QColorDialog.getColor(initial, self, f"Escolher cor para {self.key}")
+        current_hex = self.toolTip().split(":")[-1].strip()
+        dlg = QColorDialog(QColor(current_hex), self)
+        dlg.setWindowTitle(f"Escolher cor para {self.key}")
+
+        # arrasto nos sliders do diálogo: preview ao vivo com debounce mais longo
+        live = {"changed": False}
+        def _on_live(c: QColor):
+            if c.isValid():
+                live["changed"] = True
+                self._on_pick(self.key, c.name(), live=True)
+        dlg.currentColorChanged.connect(_on_live)
+
+        col = dlg.selectedColor() if dlg.exec() == QColorDialog.Accepted else QColor()
         if col.isValid():
             self._on_pick(self.key, col.name()); self._apply(col.name())
+        elif live["changed"]:
+            self._on_pick(self.key, current_hex)  # cancelado: desfaz o preview ao vivo
 
 
 # ========================= D I A L O G =========================
@@ -131,6 +354,7 @@ class ThemeEditorDialog(FramelessDialog):
             incoming = props.get("vars", props)
         incoming = {k: v for k, v in incoming.items() if isinstance(v, str) and v.startswith("#")}
         self.vars: Dict[str, str] = {**DEFAULT_VARS, **incoming}
+        self._hex_vars_cache: Optional[Dict[str, str]] = None
 
         root = QWidget(self)
         v = QVBoxLayout(root); v.setContentsMargins(12,12,12,12); v.setSpacing(10)
@@ -149,27 +373,38 @@ class ThemeEditorDialog(FramelessDialog):
         self.setCentralWidget(root)
 
         # ===== PERF: cache e debounce =====
-        self._base_qss = load_base_qss(str(cfg.BASE_QSS))
+        self._base_qss = _cached_base_qss(str(cfg.BASE_QSS))
         self._last_qss_applied: str = ""
+        self._derived_inputs: Optional[Tuple[Optional[str], ...]] = None
+        self._derived: Dict[str, str] = {}
+        self._last_chrome_qss: Tuple[str, ...] = ()
 
         self._qssUpdateTimer = QTimer(self)
         self._qssUpdateTimer.setSingleShot(True)
         self._qssUpdateTimer.timeout.connect(self._apply_preview_qss)
 
-        self._chrome_tokens = self._derive_tokens()
-        self._apply_editor_chrome(self._chrome_tokens)
-
-        self._apply_preview_qss()
+        # chrome + preview só são estilizados no 1º show (ver showEvent)
+        self._styled_on_show = False
 
         self.resize(980, 680)
         QTimer.singleShot(0, self._center_over_parent)
 
-    def _build_body(self, parent: QWidget) -> QWidget:
-        w = QWidget(parent)
-        row = QHBoxLayout(w); row.setSpacing(12); row.setContentsMargins(0,0,0,0)
-
-        # === Esquerda: WRAP com contorno + Scroll ===
-        left_wrap = QFrame(w)
+    def showEvent(self, e):
+        # 1º show: estiliza com os widgets já no tamanho real e antes do 1º paint,
+        # em vez de pagar polish em widgets ocultos durante o __init__.
+        if not self._styled_on_show:
+            self._styled_on_show = True
+            self._apply_editor_chrome(self._derive_tokens())
+            self._apply_preview_qss()
+        super().showEvent(e)
+
+    def _left_pane(self, parent: QWidget) -> Tuple[QFrame, QScrollArea, QWidget]:
+        """
+        Painel esquerdo (grupos + swatches), montado por diálogo a partir do
+        layout estático GROUPS. Os swatches ficam em self._swatches para recolorir
+        sem remontar (ex.: _reset_defaults).
+        """
+        left_wrap = QFrame(parent)
         left_wrap.setObjectName("EditorPane")           # frame com contorno
         left_wrap_l = QVBoxLayout(left_wrap)
         left_wrap_l.setContentsMargins(10, 10, 10, 10)  # igual à preview
@@ -188,6 +423,7 @@ class ThemeEditorDialog(FramelessDialog):
 
         left_l = QVBoxLayout(left); left_l.setContentsMargins(0,0,0,0); left_l.setSpacing(6)
 
+        swatches = []
         for group_title, items in GROUPS:
             box = QFrame(left); box.setObjectName("groupBox")
             gl = QGridLayout(box)
@@ -206,11 +442,26 @@ class ThemeEditorDialog(FramelessDialog):
 
                 sw = SwatchButton(key, self.vars.get(key, DEFAULT_VARS[key]), self._on_pick, box)
                 gl.addWidget(sw, r, 1, alignment=Qt.AlignRight | Qt.AlignVCenter)
+                swatches.append(sw)
                 r += 1
 
             left_l.addWidget(box)
         left_l.addStretch(1)
 
+        self._swatches: Tuple[SwatchButton, ...] = tuple(swatches)
+        return left_wrap, left_scroll, left
+
+    def _refresh_swatches(self):
+        for sw in self._swatches:
+            sw._apply(self.vars.get(sw.key, DEFAULT_VARS[sw.key]))
+
+    def _build_body(self, parent: QWidget) -> QWidget:
+        w = QWidget(parent)
+        row = QHBoxLayout(w); row.setSpacing(12); row.setContentsMargins(0,0,0,0)
+
+        # === Esquerda: WRAP com contorno + Scroll ===
+        left_wrap, left_scroll, left = self._left_pane(w)
+
         # refs para estilizar com tokens
         self._left_wrap = left_wrap
         self._left_scroll = left_scroll
@@ -269,128 +520,92 @@ class ThemeEditorDialog(FramelessDialog):
         return w
 
     # ---- tokens ----
-    def _derive_tokens(self) -> Dict[str, str]:
-
-        t = dict(self.vars)
+    def _derive_tokens(self) -> Mapping[str, str]:
+        """
+        Tokens da preview = vars do usuário + derivados, como visão ChainMap (sem
+        copiar self.vars). Os derivados só são recalculados quando suas entradas mudam.
+        """
+        v = self.vars
+        inputs = tuple(v.get(k) for k in _DERIVED_INPUTS)
+        if inputs != self._derived_inputs:
+            self._derived = self._compute_derived(ChainMap({}, v, DEFAULT_VARS))
+            self._derived_inputs = inputs
+        return ChainMap(self._derived, v, DEFAULT_VARS)
+
+    @staticmethod
+    def _compute_derived(t: ChainMap) -> Dict[str, str]:
+        """Calcula os tokens derivados; as escritas caem só na 1ª camada do ChainMap."""
+        # DEFAULT_VARS é a última camada de t: um único acesso já resolve o fallback
+        _D = DEFAULT_VARS
 
         # 1) Derivar gradiente do 'bg' se o usuário NÃO personalizou bg_start/bg_end
-        bg = t.get("bg", DEFAULT_VARS["bg"])
-        user_kept_defaults = (
-            t.get("bg_start", DEFAULT_VARS["bg_start"]) == DEFAULT_VARS["bg_start"]
-            and t.get("bg_end",   DEFAULT_VARS["bg_end"])   == DEFAULT_VARS["bg_end"]
-        )
+        bg = t["bg"]
+        user_kept_defaults = t["bg_start"] == _D["bg_start"] and t["bg_end"] == _D["bg_end"]
         if user_kept_defaults:
             t["bg_start"] = _darken_hex(bg, 0.95)
             t["bg_end"]   = _darken_hex(bg, 0.80)
 
         # 2) content_bg: usado em painéis / TopBar
-        t["content_bg"] = t.get("surface", DEFAULT_VARS["surface"])
+        t["content_bg"] = t["surface"]
 
         # 3) loading_overlay_bg translúcido a partir do accent (fallbacks)
-        def _rgba(hex_color: str, alpha: float) -> str:
-            h = hex_color.lstrip("#")
-            r = int(h[0:2], 16); g = int(h[2:4], 16); b = int(h[4:6], 16)
-            a = max(0.0, min(1.0, alpha))
-            return f"rgba({r},{g},{b},{a:.3f})"
-
-        base_for_overlay = t.get("accent") or t.get("slider") or DEFAULT_VARS["accent"]
+        base_for_overlay = t["accent"] or t["slider"] or _D["accent"]
         t["loading_overlay_bg"] = _rgba(base_for_overlay, 0.25)
 
-        return t
+        return t.maps[0]
 
     # Estiliza o painel esquerdo (fora do preview) com surface/text/slider/box_border
-    def _apply_editor_chrome(self, tokens: Dict[str, str]):
+    def _apply_editor_chrome(self, tokens: Mapping[str, str]):
         if not all(hasattr(self, x) for x in ("_left_root", "_left_scroll", "_left_wrap")):
             return
-        surface = tokens.get("surface", "#383838")
-        text = tokens.get("text", "#e5e5e5")
-        slider = tokens.get("slider", "#e11717")
-        border = tokens.get("box_border", "#666666")
-
-        # Contorno e fundo do painel
-        self._left_wrap.setStyleSheet(
-            f"""
-            QFrame#EditorPane {{
-                background: {surface};
-                border: 1px solid {border};
-                border-radius: 10px;
-            }}
-            """
-        )
-
-        # Fundo do conteúdo = surface; filhos transparentes herdam o fundo
-        self._left_root.setStyleSheet(
-            f"""
-            QWidget#EditorLeft {{
-                background: {surface};
-                color: {text};
-            }}
-            QWidget#EditorLeft * {{
-                color: {text};
-                background: transparent;
-            }}
-            QFrame#groupBox {{
-                background: transparent;
-                border: none;
-            }}
-            """
-        )
-
-        # Scrollbar fina + transparências no scroll/viewport
-        self._left_scroll.setStyleSheet(
-            f"""
-            QScrollArea#EditorScroll {{
-                background: transparent;
-            }}
-            QScrollArea#EditorScroll > QWidget {{
-                background: transparent;
-            }}
-            QScrollArea#EditorScroll > QWidget > QWidget {{
-                background: transparent;
-            }}
-            QScrollBar:vertical {{
-                width: 6px;
-                margin: 0;
-                background: transparent;
-            }}
-            QScrollBar::handle:vertical {{
-                min-height: 20px;
-                border-radius: 3px;
-                background: {slider};
-                border: 1px solid {border};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: transparent; }}
-            """
-        )
+        g = tokens.get
+        values = {
+            "surface": g("surface", "#383838"), "text": g("text", "#e5e5e5"),
+            "slider": g("slider", "#e11717"), "border": g("box_border", "#666666"),
+            "swatch_radius": SWATCH_SIZE // 2,
+        }
+        pane_qss, left_qss, scroll_qss = (tpl.format_map(values) for tpl in _CHROME_TPLS)
+        if (pane_qss, left_qss, scroll_qss) == self._last_chrome_qss:
+            return
+
+        self._left_wrap.setStyleSheet(pane_qss)
+        self._left_root.setStyleSheet(left_qss)
+        self._left_scroll.setStyleSheet(scroll_qss)
+        self._last_chrome_qss = (pane_qss, left_qss, scroll_qss)
 
     # ---- aplica QSS na preview com cache/compare ----
-    def _apply_preview_qss(self):
+    def _scoped_preview_qss(self) -> str:
+        global _DEFAULT_SCOPED
+        is_default = self.vars == DEFAULT_VARS
+        if is_default and _DEFAULT_SCOPED and _DEFAULT_SCOPED[0] is self._base_qss:
+            return _DEFAULT_SCOPED[1]
+
         tokens = self._derive_tokens()
+        # estados repetidos (ex.: alternar entre duas cores) saem do cache
+        scoped_qss = _render_scoped(self._base_qss, tuple(sorted(tokens.items())))
+        if is_default:
+            _DEFAULT_SCOPED = (self._base_qss, scoped_qss)
+        return scoped_qss
 
-        base_rendered = render_qss_from_base(self._base_qss, tokens)
-        scoped_qss = _scope_qss(base_rendered, "ThemePreview")
-        scoped_qss += (
-            f"\n#ThemePreview QFrame#OuterPanel "
-            f"{{ background: {tokens.get('surface', DEFAULT_VARS['surface'])}; }}"
-        )
+    def _apply_preview_qss(self):
+        scoped_qss = self._scoped_preview_qss()
 
         if scoped_qss == self._last_qss_applied:
             return
 
-        self.preview_root.setUpdatesEnabled(False)
+        # setStyleSheet já repolisha a subárvore; unpolish/polish manual só dobrava o custo.
+        # Updates travados no diálogo inteiro: o repolish em cascata dos filhos da
+        # preview vira um único repaint (setUpdatesEnabled(True) já chama update()).
+        self.setUpdatesEnabled(False)
         try:
-            st = self.preview_root.style()
-            st.unpolish(self.preview_root)
             self.preview_root.setStyleSheet(scoped_qss)
-            st.polish(self.preview_root)
+            self.preview_root.ensurePolished()
             self._last_qss_applied = scoped_qss
         finally:
-            self.preview_root.setUpdatesEnabled(True)
-            self.preview_root.update()
+            self.setUpdatesEnabled(True)
 
-    # debounce ~60 fps
-    def _schedule_qss_update(self, delay_ms: int = 16):
+    # debounce ~60 fps; durante o arrasto no QColorDialog usa janela maior
+    def _schedule_qss_update(self, delay_ms: int = QSS_DEBOUNCE_MS):
         if self._qssUpdateTimer.isActive():
             self._qssUpdateTimer.stop()
         self._qssUpdateTimer.start(delay_ms)
@@ -398,20 +613,27 @@ class ThemeEditorDialog(FramelessDialog):
     # slots
     def _reset_defaults(self):
         self.vars = dict(DEFAULT_VARS)
+        self._hex_vars_cache = None
+        self._refresh_swatches()
         self._schedule_qss_update()
 
-    def _on_pick(self, key: str, color_hex: str):
+    def _on_pick(self, key: str, color_hex: str, live: bool = False):
         self.vars[key] = color_hex
-        self._schedule_qss_update()
+        self._hex_vars_cache = None
+        self._schedule_qss_update(QSS_DEBOUNCE_DRAG_MS if live else QSS_DEBOUNCE_MS)
+
+    def _hex_vars(self) -> Dict[str, str]:
+        """vars válidas (#hex); recalculado só após _on_pick/_reset_defaults."""
+        if self._hex_vars_cache is None:
+            self._hex_vars_cache = {
+                k: v for k, v in self.vars.items() if isinstance(v, str) and v.startswith("#")
+            }
+        return self._hex_vars_cache
 
     # API pública
     def get_theme_data(self) -> Dict[str, Dict[str, str]]:
-        out = dict(DEFAULT_VARS)
-        out.update({k: v for k, v in self.vars.items() if isinstance(v, str) and v.startswith("#")})
-        return {"vars": out}
+        return {"vars": {**DEFAULT_VARS, **self._hex_vars()}}
 
     @property
     def props(self) -> Dict[str, str]:
-        out = dict(DEFAULT_VARS)
-        out.update({k: v for k, v in self.vars.items() if isinstance(v, str) and v.startswith("#")})
-        return out
+        return {**DEFAULT_VARS, **self._hex_vars()}
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from typing import Optional
+import os
 import shutil
 import json
 import re
@@ -38,10 +39,14 @@ CACHE_DIR    = (ASSETS_DIR / "cache").resolve()
 USER_QSS_DIR = (ASSETS_DIR / "qss").resolve()
 
 # ---------------------------------------------------------------------------
-# Garantir diretórios
+# Garantir diretórios (só no 1º start; depois o marcador evita os syscalls)
 # ---------------------------------------------------------------------------
-for _p in (THEMES_DIR, CACHE_DIR, USER_QSS_DIR):
-    _p.mkdir(parents=True, exist_ok=True)
+_BOOTSTRAP_MARKER = CACHE_DIR / ".bootstrapped"
+_NEEDS_BOOTSTRAP = not _BOOTSTRAP_MARKER.exists()
+
+if _NEEDS_BOOTSTRAP:
+    for _p in (THEMES_DIR, CACHE_DIR, USER_QSS_DIR):
+        _p.mkdir(parents=True, exist_ok=True)
 
 # ---------------------------------------------------------------------------
 # BASE_QSS: prioriza arquivo local (se existir), caso contrário usa o de assets
@@ -53,19 +58,27 @@ BASE_QSS = _user_base_qss if _user_base_qss.exists() else _asset_base_qss
 # ---------------------------------------------------------------------------
 # Bootstrap de temas: copia temas de assets → pasta interna se estiver vazia
 # ---------------------------------------------------------------------------
-try:
-    has_any_theme = any(THEMES_DIR.glob("*.json"))
-    if (not has_any_theme) and _ASSET_THEMES_DIR.exists():
-        for src in _ASSET_THEMES_DIR.glob("*.json"):
-            dst = THEMES_DIR / src.name
-            try:
-                if str(src.resolve()) != str(dst.resolve()):  # evita copiar para si mesmo
-                    shutil.copy2(src, dst)
-            except Exception:
-                pass
-except Exception:
-    # não interrompe o app se a cópia falhar
-    pass
+def _has_json_file(d: Path) -> bool:
+    with os.scandir(d) as it:
+        return any(e.name.endswith(".json") and e.is_file() for e in it)
+
+if _NEEDS_BOOTSTRAP:
+    try:
+        # ambos já vêm de .resolve(): se forem a mesma pasta não há o que copiar
+        if _ASSET_THEMES_DIR != THEMES_DIR and not _has_json_file(THEMES_DIR) \
+                and _ASSET_THEMES_DIR.is_dir():
+            with os.scandir(_ASSET_THEMES_DIR) as it:
+                for e in it:
+                    if not (e.name.endswith(".json") and e.is_file()):
+                        continue
+                    try:
+                        shutil.copy2(e.path, THEMES_DIR / e.name)
+                    except Exception:
+                        pass
+        _BOOTSTRAP_MARKER.touch()
+    except Exception:
+        # não interrompe o app se a cópia falhar (tenta de novo no próximo start)
+        pass
 
 # ---------------------------------------------------------------------------
 # Observações:
@@ -84,32 +97,45 @@ def _slugify_theme(name: str) -> str:
     s = re.sub(r"[^A-Za-z0-9]+", "-", s).strip("-").lower()
     return s
 
-def _read_exec_settings_theme() -> Optional[str]:
-    # 1) Caminho via settings (preferível)
-    json_path = None
-    try:
-        json_path = (CACHE_DIR / "_ui_exec_settings.json").resolve()
-    except Exception:
-        json_path = None
+# Candidatos a _ui_exec_settings.json, em ordem de preferência:
+#  1) caminho via settings; 2) fallback na estrutura padrão (repo/app/assets/cache)
+_EXEC_SETTINGS_NAME = "_ui_exec_settings.json"
+_EXEC_SETTINGS_REPO = BASE_DIR.parents[1] if len(BASE_DIR.parents) >= 2 else BASE_DIR
+_EXEC_SETTINGS_CANDIDATES = (
+    str(CACHE_DIR / _EXEC_SETTINGS_NAME),
+    str(_EXEC_SETTINGS_REPO / "app" / "assets" / "cache" / _EXEC_SETTINGS_NAME),
+)
 
-    # 2) Fallback: estrutura padrão do projeto (repo/app/assets/cache)
-    if not json_path or not json_path.exists():
-        here = Path(__file__).resolve()
-        repo = here.parents[2] if len(here.parents) >= 3 else here.parent
-        alt = (repo / "app" / "assets" / "cache" / "_ui_exec_settings.json")
-        if alt.exists():
-            json_path = alt.resolve()
+def _find_exec_settings() -> Optional[tuple[str, os.stat_result]]:
+    """Primeiro candidato existente; um único stat() por caminho testado."""
+    for p in _EXEC_SETTINGS_CANDIDATES:
+        try:
+            return p, os.stat(p)
+        except OSError:
+            continue
+    return None
 
-    if not json_path or not json_path.exists():
+# Último resultado lido: (caminho, mtime_ns, tamanho, tema). Invalidado quando o arquivo muda.
+_exec_cache: Optional[tuple[str, int, int, Optional[str]]] = None
+
+def _read_exec_settings_theme() -> Optional[str]:
+    global _exec_cache
+    found = _find_exec_settings()
+    if not found:
         return None
+    json_path, st = found
+    if _exec_cache and _exec_cache[:3] == (json_path, st.st_mtime_ns, st.st_size):
+        return _exec_cache[3]
 
     # 3) Ler o JSON com segurança
+    theme: Optional[str] = None
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        theme = data.get("theme")
-        if isinstance(theme, str) and theme.strip():
-            return theme.strip()
+        raw = data.get("theme")
+        if isinstance(raw, str) and raw.strip():
+            theme = raw.strip()
     except Exception:
         pass
-    return None
\ No newline at end of file
+    _exec_cache = (json_path, st.st_mtime_ns, st.st_size, theme)
+    return theme
\ No newline at end of file
@@ -1,26 +1,41 @@
 ﻿from __future__ import annotations
 import argparse
+import atexit
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 import os
 import shutil
 import subprocess
 import tempfile
 import re
+import string
 import sys
 import json
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import importlib
 
 
 # === utils de nome ===
+_RX_SNAKE_WORD = re.compile(r"(.)([A-Z][a-z]+)")
+_RX_SNAKE_CAP = re.compile(r"([a-z0-9])([A-Z])")
+_RX_NON_WORD = re.compile(r"[\W]+")
+_RX_CAMEL_SPLIT = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=256)
 def to_snake(name: str) -> str:
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name.strip())
-    s2 = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1)
-    return re.sub(r"[\W]+", "_", s2).lower().strip("_")
+    s1 = _RX_SNAKE_WORD.sub(r"\1_\2", name.strip())
+    s2 = _RX_SNAKE_CAP.sub(r"\1_\2", s1)
+    return _RX_NON_WORD.sub("_", s2).lower().strip("_")
 
 
+@lru_cache(maxsize=256)
 def to_camel(name: str) -> str:
-    parts = re.split(r"[\W_]+", name.strip())
+    parts = _RX_CAMEL_SPLIT.split(name.strip())
     return "".join(p.capitalize() for p in parts if p)
 
 
@@ -32,7 +47,13 @@ def repo_root() -> Path:
     pois o pai de ui/ não é o repositório do usuário. Preferimos o CWD e,
     se possível, subimos procurando um diretório que contenha "app/".
     """
-    cwd = Path.cwd().resolve()
+    # memoizado por CWD: `init` faz chdir para o destino antes de criar páginas
+    return _repo_root_for(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _repo_root_for(cwd_str: str) -> Path:
+    cwd = Path(cwd_str).resolve()
     # procura por uma pasta "app" começando do CWD e subindo
     for p in [cwd, *cwd.parents]:
         if (p / "app").exists():
@@ -42,19 +63,27 @@ def repo_root() -> Path:
 
 
 def app_dir() -> Path:
-    return repo_root() / "app"
+    return _project_paths(repo_root())[0]
 
 
 def pages_dir() -> Path:
-    return app_dir() / "pages"
+    return _project_paths(repo_root())[1]
 
 
 def assets_dir() -> Path:
-    return app_dir() / "assets"
+    return _project_paths(repo_root())[2]
 
 
 def manifest_path() -> Path:
-    return assets_dir() / "pages_manifest.json"
+    return _project_paths(repo_root())[3]
+
+
+@lru_cache(maxsize=8)
+def _project_paths(root: Path) -> tuple[Path, Path, Path, Path]:
+    """(app, app/pages, app/assets, manifesto) montados uma vez por raiz."""
+    app = root / "app"
+    assets = app / "assets"
+    return app, app / "pages", assets, assets / "pages_manifest.json"
 
 # Repositório padrão do framework (clone para copiar todos os arquivos)
 DEFAULT_REPO_URL = "https://github.com/Skkiler/framework-pyside6.git"
@@ -161,49 +190,175 @@ def build(task_runner=None, theme_service=None) -> QWidget:
     return ExamplesPage(task_runner=task_runner, theme_service=theme_service)
 """
 
+# Templates pré-compilados em (literal, campo): preencher vira só lookups + join
+def _compile_template(tpl: str) -> tuple[tuple[str, str | None], ...]:
+    return tuple((lit, field) for lit, field, _spec, _conv in string.Formatter().parse(tpl))
+
+
+def _fill_template(segments: tuple[tuple[str, str | None], ...], values: dict) -> str:
+    return "".join(lit + (str(values[f]) if f else "") for lit, f in segments)
+
+
+_PAGE_SEGMENTS = _compile_template(PAGE_TEMPLATE)
+_EXAMPLES_SEGMENTS = _compile_template(EXAMPLES_TEMPLATE)
+
 
 # === manifest helpers ===
+# Manifesto em memória por caminho: várias criações no mesmo processo fazem um
+# parse só e uma escrita em flush_manifest() (fim do comando ou saída do processo).
+_MANIFEST_CACHE: dict[Path, list[dict]] = {}
+_MANIFEST_SIG: dict[Path, tuple[int, int]] = {}   # (mtime_ns, tamanho) das entradas limpas
+_MANIFEST_DIRTY: set[Path] = set()
+_MANIFEST_ATEXIT = False
+
+
 def _manifest_load(path: Path) -> list[dict]:
-    if not path.exists():
+    if path in _MANIFEST_DIRTY:
+        return list(_MANIFEST_CACHE[path])
+    try:
+        st = path.stat()
+    except OSError:
         return []
+    sig = (st.st_mtime_ns, st.st_size)
+    if _MANIFEST_SIG.get(path) == sig:
+        return list(_MANIFEST_CACHE[path])
     try:
-        return json.loads(path.read_text(encoding="utf-8")) or []
+        items = json.loads(path.read_text(encoding="utf-8")) or []
     except Exception:
         return []
-
-
-def _manifest_save(path: Path, items: list[dict]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding="utf-8")
+    _MANIFEST_CACHE[path] = items
+    _MANIFEST_SIG[path] = sig
+    return list(items)
+
+
+@dataclass
+class _ManifestState:
+    """Itens do manifesto por rota + chaves (order, label, rota) mantidas ordenadas."""
+    items_by_route: dict[str, dict] = field(default_factory=dict)
+    sorted_keys: list[tuple[int, str, str]] = field(default_factory=list)
+    _key_by_route: dict[str, tuple[int, str, str]] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def _sort_key(item: dict) -> tuple[int, str, str]:
+        route = item.get("route")
+        return (int(item.get("order", 1000)), item.get("label") or route, route)
+
+    @classmethod
+    def from_items(cls, items: list[dict]) -> "_ManifestState":
+        state = cls()
+        for it in items:
+            if isinstance(it, dict) and it.get("route"):
+                state.upsert(it)
+        return state
+
+    def upsert(self, item: dict) -> None:
+        route = item.get("route")
+        old = self._key_by_route.get(route)
+        if old is not None:
+            del self.sorted_keys[bisect_left(self.sorted_keys, old)]
+        key = self._sort_key(item)
+        self.items_by_route[route] = item
+        self._key_by_route[route] = key
+        insort(self.sorted_keys, key)
+
+    def items(self) -> list[dict]:
+        by_route = self.items_by_route
+        return [by_route[k[2]] for k in self.sorted_keys]
+
+
+def _manifest_save(path: Path, items: list[dict] | _ManifestState) -> None:
+    """Atualiza o manifesto em memória; a escrita em disco fica para flush_manifest()."""
+    global _MANIFEST_ATEXIT
+    _MANIFEST_CACHE[path] = items.items() if isinstance(items, _ManifestState) else list(items)
+    _MANIFEST_SIG.pop(path, None)
+    _MANIFEST_DIRTY.add(path)
+    if not _MANIFEST_ATEXIT:
+        atexit.register(flush_manifest)
+        _MANIFEST_ATEXIT = True
+
+
+def flush_manifest() -> None:
+    """Grava os manifestos pendentes (conteúdo idêntico ao do disco não é regravado)."""
+    while _MANIFEST_DIRTY:
+        path = _MANIFEST_DIRTY.pop()
+        data = json.dumps(_MANIFEST_CACHE[path], ensure_ascii=False, indent=2).encode("utf-8")
+        try:
+            st = path.stat()
+            same = st.st_size == len(data) and path.read_bytes() == data
+        except OSError:
+            same = False
+        if not same:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            st = path.stat()
+        _MANIFEST_SIG[path] = (st.st_mtime_ns, st.st_size)
 
 
 def _manifest_upsert_item(items: list[dict], item: dict) -> list[dict]:
-    by_route = {it.get("route"): it for it in items if isinstance(it, dict) and it.get("route")}
-    by_route[item.get("route")] = item
-    out = list(by_route.values())
-    out.sort(key=lambda d: (int(d.get("order", 1000)), d.get("label") or d.get("route")))
-    return out
+    """Compat: upsert pontual sobre uma lista (use _ManifestState para lotes)."""
+    state = _ManifestState.from_items(items)
+    state.upsert(item)
+    return state.items()
 
 
 # === discovery: import app.pages.* e extrair PAGE/build ===
 def discover_page_specs() -> list[dict]:
-    specs: list[dict] = []
     root = pages_dir()
-    if not root.exists():
-        return specs
+    try:
+        mtime_ns = root.stat().st_mtime_ns
+    except OSError:
+        return []
+    # criar/remover página muda o mtime da pasta e invalida o cache
+    return [dict(s) for s in _discover_page_specs(str(root), str(repo_root()), mtime_ns)]
 
-    if str(repo_root()) not in sys.path:
-        sys.path.insert(0, str(repo_root()))
 
-    for py in sorted(root.rglob("*.py")):
-        if py.name == "__init__.py":
-            continue
-        rel = py.relative_to(app_dir()).with_suffix("")  # pages/foo/bar
-        parts = [p for p in rel.parts]
-        parts[0] = "pages"  # app/pages -> app.pages
-        mod_name = "app." + ".".join(parts)
+# Raízes de repo já inseridas no sys.path (evita a varredura linear a cada descoberta)
+_SYS_PATH_PATCHED: set[str] = set()
+
+
+def _iter_page_files(root: str):
+    """Caminhos dos .py de páginas (exceto __init__.py), recursivo via os.scandir."""
+    with os.scandir(root) as it:
+        for entry in it:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_page_files(entry.path)
+            elif name.endswith(".py") and name != "__init__.py":
+                yield entry.path
+
+
+def _safe_import(mod_name: str):
+    try:
+        return importlib.import_module(mod_name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _discover_page_specs(root_str: str, repo_str: str, mtime_ns: int) -> tuple[dict, ...]:
+    specs: list[dict] = []
+
+    if repo_str not in _SYS_PATH_PATCHED:
+        if repo_str not in sys.path:
+            sys.path.insert(0, repo_str)
+        _SYS_PATH_PATCHED.add(repo_str)
+
+    modules = sys.modules
+    entries = []
+    for path in _iter_page_files(root_str):
+        rel = os.path.relpath(path, root_str)[:-3]  # foo/bar (app/pages -> app.pages)
+        entries.append((rel, "app.pages." + rel.replace(os.sep, ".")))
+
+    # Importa em paralelo (I/O de .py/.pyc); o laço abaixo só consulta sys.modules
+    # e reimporta em série o que falhou aqui (ex.: deadlock entre páginas que se importam).
+    pending = [m for _, m in entries if m not in modules]
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2, len(pending))) as ex:
+            list(ex.map(_safe_import, pending))
+
+    for rel, mod_name in entries:
         try:
-            mod = importlib.import_module(mod_name)
+            mod = modules.get(mod_name) or importlib.import_module(mod_name)
         except Exception:
             continue
         route = None; label = None; sidebar = True; order = 1000
@@ -215,7 +370,7 @@ def discover_page_specs() -> list[dict]:
             order = int(md.get("order", 1000))
         # fallback: inferir a partir do nome
         if not route:
-            last = py.stem
+            last = os.path.basename(rel)
             if last.endswith("_page"):
                 last = last[:-5]
             route = last.replace("_", "-")
@@ -232,15 +387,17 @@ def discover_page_specs() -> list[dict]:
                 "order": order,
                 "factory": factory,
             })
-    specs.sort(key=lambda d: (int(d.get("order", 1000)), d.get("label") or d.get("route")))
-    return specs
+    # a ordem do scandir é arbitrária: factory desempata de forma estável
+    specs.sort(key=lambda d: (int(d.get("order", 1000)), d.get("label") or d.get("route"), d["factory"]))
+    return tuple(specs)
 
 
 # === commands ===
 def cmd_new_page(args):
+    _to_camel, _to_snake = to_camel, to_snake
     pdir = pages_dir(); pdir.mkdir(parents=True, exist_ok=True)
-    class_name = to_camel(args.name) + "Page"
-    route = (args.route or to_snake(args.name)).replace("\\", "/").strip("/")
+    class_name = _to_camel(args.name) + "Page"
+    route = (args.route or _to_snake(args.name)).replace("\\", "/").strip("/")
     label = args.label or args.name
     order = int(args.order)
     sidebar = bool(args.sidebar)
@@ -251,22 +408,22 @@ def cmd_new_page(args):
         print(f"[ERRO] Arquivo jÃ¡ existe: {target}\nUse --force para sobrescrever.")
         sys.exit(2)
 
-    content = PAGE_TEMPLATE.format(
+    content = _fill_template(_PAGE_SEGMENTS, dict(
         now=datetime.now().isoformat(timespec='seconds'),
         route=route, label=label, order=order, sidebar="True" if sidebar else "False", class_name=class_name
-    )
+    ))
     target.write_text(content, encoding="utf-8")
 
     # manifest: upsert
-    man = manifest_path(); items = _manifest_load(man)
-    items = _manifest_upsert_item(items, {
+    man = manifest_path(); state = _ManifestState.from_items(_manifest_load(man))
+    state.upsert({
         "route": route,
         "label": label,
         "sidebar": sidebar,
         "order": order,
         "factory": f"app.pages.{target.stem}:build",
     })
-    _manifest_save(man, items)
+    _manifest_save(man, state)
 
     print(f"[OK] PÃ¡gina criada: {target}")
     print(f" - Rota: {route}")
@@ -292,43 +449,68 @@ def cmd_scaffold_examples(args):
     if target.exists() and not args.force:
         print(f"[ERRO] Arquivo jÃ¡ existe: {target} (--force para sobrescrever)")
         sys.exit(2)
-    target.write_text(EXAMPLES_TEMPLATE.format(now=datetime.now().isoformat(timespec='seconds')), encoding="utf-8")
+    target.write_text(_fill_template(_EXAMPLES_SEGMENTS, {"now": datetime.now().isoformat(timespec='seconds')}), encoding="utf-8")
 
     # add to manifest
-    man = manifest_path(); items = _manifest_load(man)
-    items = _manifest_upsert_item(items, {
+    man = manifest_path(); state = _ManifestState.from_items(_manifest_load(man))
+    state.upsert({
         "route": "examples",
         "label": "Exemplos",
         "sidebar": True,
         "order": 900,
         "factory": "app.pages.examples_widgets_page:build",
     })
-    _manifest_save(man, items)
+    _manifest_save(man, state)
     print(f"[OK] PÃ¡gina de exemplos criada e manifesto atualizado: {target}")
 
 
+def _pages_stamp(root: Path, man: Path) -> str | None:
+    """Assinatura de (caminho, mtime, tamanho) das páginas + do próprio manifesto."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        for path in sorted(_iter_page_files(str(root))):
+            st = os.stat(path)
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8", "surrogateescape"))
+        # manifesto editado por outro comando/à mão também invalida
+        st = man.stat()
+        h.update(f"{man}\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8", "surrogateescape"))
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
 def cmd_manifest_update(args):
-    specs = discover_page_specs()
     man = manifest_path()
+    stamp_path = man.with_name(man.name + ".stamp")
+    root = pages_dir()
+    stamp = _pages_stamp(root, man)
+    try:
+        if stamp and stamp_path.read_text(encoding="utf-8") == stamp:
+            print(f"[OK] Manifesto já atualizado: {man}")
+            return
+    except OSError:
+        pass
+
+    specs = discover_page_specs()
     _manifest_save(man, specs)
+    flush_manifest()  # o carimbo usa o stat do manifesto já gravado
     print(f"[OK] Manifesto reescrito com {len(specs)} entradas: {man}")
 
+    stamp = _pages_stamp(root, man)
+    if stamp:
+        try:
+            stamp_path.write_text(stamp, encoding="utf-8")
+        except OSError:
+            pass
+
 
 def _safe_remove(p: Path):
     try:
         if p.is_file():
-            p.unlink()
+            p.unlink(missing_ok=True)
         elif p.is_dir():
-            for sub in p.rglob('*'):
-                if sub.is_file():
-                    sub.unlink()
-            for sub in sorted(p.glob('**/*'), reverse=True):
-                if sub.exists() and sub.is_dir():
-                    try:
-                        sub.rmdir()
-                    except Exception:
-                        pass
-            p.rmdir()
+            # melhor esforço, como antes: o que não puder ser removido fica
+            shutil.rmtree(p, ignore_errors=True)
     except Exception:
         pass
 
@@ -417,7 +599,10 @@ def build_parser():
 def main(argv=None):
     parser = build_parser()
     args = parser.parse_args(argv)
-    args.func(args)
+    try:
+        args.func(args)
+    finally:
+        flush_manifest()
 
 """
 NOVO: Comando `init` para criar um novo projeto.
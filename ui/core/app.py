@@ -2,41 +2,83 @@
 
 from __future__ import annotations
 
+from functools import lru_cache, partial
+from itertools import accumulate
 from pathlib import Path
-from typing import Optional, Iterable, Any
+from typing import Optional, Iterable
 import json
+import os
+import re
+import sys
+import threading
+import unicodedata
 
 from PySide6.QtGui import QIcon, QShortcut, QKeySequence
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QApplication, QFrame, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QApplication, QFrame
 from PySide6.QtCore import QFileSystemWatcher, QTimer, Qt
 
-from .router import Router
 from .settings import Settings
 from .theme_service import ThemeService
 from .frameless_window import FramelessWindow
 
-from ui.services.theme_repository_json import JsonThemeRepository
-from ui.widgets.topbar import TopBar
-from ui.widgets.overlay_sidebar import OverlaySidePanel
-from ui.widgets.push_sidebar import PushSidePanel
-from ui.widgets.titlebar import TitleBar
-from ui.widgets.toast import notification_bus
-from ui.widgets.settings_sidebar import SettingsSidePanel
-
-from .utils.helpers import create_layout_widget
 from .utils.resource_manager import ResourceManager
-from .utils.page_manager import PageManager
 from .utils.paths import safe_icon
 from .utils.factories import call_with_known_kwargs
 
-from app.pages.notificacoes import NotificationCenter
-from app.pages.settings import build as build_settings_page
+# Router, widgets, serviços e páginas do app (settings puxa o theme_editor) são
+# importados sob demanda em __init__/_build_*: importar este módulo não os carrega.
+# O Qt fica no topo: FramelessWindow (classe base) já depende dele.
 
 try:
     from app import settings as S
 except Exception:
     S = None
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+# ASCII: alfanuméricos ficam, o resto vira '-' (caminho rápido do _slugify)
+_SLUG_TABLE = bytes(c if (48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122) else 45 for c in range(256))
+
+_WIN = sys.platform == "win32"
+
+
+def _dir_files(d: str) -> frozenset[str]:
+    """Nomes (normcase) de uma pasta; pasta inexistente = vazio."""
+    try:
+        mtime_ns = os.stat(d).st_mtime_ns
+    except OSError:
+        return frozenset()
+    # chave inclui o mtime da pasta: ícone novo/removido gera nova listagem
+    return _dir_files_at(d, mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _slugify(name: str) -> str:
+    """Slug ASCII do nome do tema (conjunto pequeno e fechado: memoizado)."""
+    if name.isascii():
+        # NFKD não altera ASCII: uma translate em C + junção dos trechos
+        parts = name.encode("ascii").translate(_SLUG_TABLE).decode("ascii").split("-")
+        return "-".join(p for p in parts if p).lower() or "default"
+    s = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return _SLUG_RE.sub("-", s).strip("-").lower() or "default"
+
+
+@lru_cache(maxsize=256)
+def _dir_files_at(d: str, mtime_ns: int) -> frozenset[str]:
+    """Um único scandir por (pasta, mtime)."""
+    try:
+        with os.scandir(d) as it:
+            return frozenset(os.path.normcase(e.name) for e in it)
+    except OSError:
+        return frozenset()
+
+
+def _prefetch_icon_dirs(roots: Iterable[Path]) -> None:
+    """Aquece o _dir_files das pastas fixas de ícones (roda fora da thread da GUI)."""
+    join = os.path.join
+    for root in map(str, roots):
+        for d in (join(root, "icons"), join(root, "icons", "themes"), join(root, "icons", "app"), root):
+            _dir_files(d)
+
 
 class AppShell(FramelessWindow):
     """
@@ -45,16 +87,36 @@ class AppShell(FramelessWindow):
     """
 
     def __init__(self, title: str, assets_dir: str, themes_dir: str, base_qss_path: str, settings: Settings):
+        from .router import Router
+        from ui.services.theme_repository_json import JsonThemeRepository
+        from app.pages.settings import build as build_settings_page
+
         super().__init__()
+        self._build_settings_page = build_settings_page
         self.setWindowTitle(title)
         self.setObjectName("RootWindow")
         self.resize(1100, 720)
         self._page_labels = {}
+        self._route_pages: dict[str, QWidget] = {}
+
+        # Ícone por tema: caminho resolvido por slugs (válido enquanto as raízes não mudarem)
+        self._icon_path_cache: dict[tuple[str, ...], Path | None] = {}
+        self._icon_cache_roots: tuple[Path, ...] = ()
+        # JSON de cache (_ui_exec_settings.json) já lido: ((mtime_ns, tamanho), dados)
+        self._cache_json_cached: tuple[tuple[int, int], dict | None] | None = None
+        self._last_applied_icon: Path | None = None
+        self._pending_icon: QIcon | None = None
+        self._last_icon_key: tuple[str, tuple[int, int] | None] | None = None
 
         # Inicializa gerenciadores
         self.resources = ResourceManager(assets_dir)
         self.settings = settings
-        self.page_manager = PageManager()
+        # Raízes de ícones são fixas durante o processo: resolve() uma vez só
+        self._assets_roots_tuple: tuple[Path, ...] = tuple(self._compute_assets_roots())
+        # Idem para o JSON de cache (sem cache_dir no Settings o fallback faz stats)
+        self._cache_json_file: Path | None = self._compute_cache_json_path()
+        self._is_heavy_anim = False
+        self._icon_update_deferred = False
 
         # Router com histórico (limit 100)
         self.router = Router(history_limit=100)
@@ -68,34 +130,17 @@ class AppShell(FramelessWindow):
             animate_ms_default=450,
             cache_dir=self.resources.cache_dir,
         )
+        self._theme_name_getter = self.theme_service.current
+
+        # Lista as pastas de ícones em paralelo à montagem da UI/páginas; só toca
+        # no sistema de arquivos (widgets continuam na thread da GUI)
+        threading.Thread(
+            target=_prefetch_icon_dirs, args=(self._assets_roots(),), daemon=True
+        ).start()
 
         # Constrói a UI
         self._build_ui(title)
 
-    def register_pages(self, specs: Iterable[tuple[str, Any]], *, task_runner=None) -> None:
-        """
-        Registra páginas na aplicação.
-        
-        Args:
-            specs: Iterável de tuplas (page_id, factory)
-            task_runner: Runner opcional para tarefas assíncronas
-        """
-        dependencies = {"theme_service": self.theme_service}
-        if task_runner:
-            dependencies["task_runner"] = task_runner
-
-        for page_id, factory in specs:
-            self.page_manager.register(page_id, factory, **dependencies)
-            
-    def _go(self, page_id: str, **kwargs: Any) -> None:
-        """Navega para uma página."""
-        if not self.page_manager.has_page(page_id):
-            return
-            
-        page = self.page_manager.create(page_id, **kwargs)
-        if page:
-            self.router.push(page)
-            
     def _build_ui(self, title: str) -> None:
         """Constrói os elementos principais da UI."""
         # Widget central
@@ -106,54 +151,23 @@ class AppShell(FramelessWindow):
         self._wire_router_events()
         self._setup_theme_icon_sync()
 
-        # Sidebar de navegação
-        self.sidebar = OverlaySidePanel(
-            parent=central,
-            use_scrim=True,
-            close_on_scrim=True,
-            close_on_select=True
-        )
-        self.sidebar.pageSelected.connect(self._go)
-
-        # Sidebar de configurações
-        self._settings_widget = build_settings_page(theme_service=self.theme_service)
-        self.settings_panel = SettingsSidePanel(
-            parent=central,
-            content=self._settings_widget,
-            use_scrim=True,
-            close_on_scrim=True,
-        )
+        # Sidebar de navegação: montada só na 1ª abertura (_toggle_sidebar);
+        # até lá as páginas registradas ficam em _sidebar_pages
+        self.sidebar = None
+        self._sidebar_pages: list[tuple[str, str]] = []
+
+        # Sidebar de configurações: montada só na 1ª abertura (_toggle_settings_panel)
+        self._settings_widget = None
+        self.settings_panel = None
 
         # Centro de Notificações
         self._build_notification_center(central)
 
-    def _build_central(self, title: str) -> QWidget:
-        """Constrói o widget central com layout."""
-        # Container principal
-        container = create_layout_widget(QVBoxLayout, parent=self)
-        
-        # Barra de título
-        titlebar = TitleBar(title, parent=container)
-        titlebar.minimizeClicked.connect(self.showMinimized)
-        titlebar.maximizeClicked.connect(self.toggleMaximized)
-        titlebar.closeClicked.connect(self.close)
-        container.layout().addWidget(titlebar)
-
-        # Container de conteúdo com layout horizontal
-        content = create_layout_widget(QHBoxLayout, parent=container)
-        content.layout().setContentsMargins(0, 0, 0, 0)
-        container.layout().addWidget(content)
-
-        # Área principal de conteúdo
-        self._central_widget = QWidget()
-        self._central_widget.setObjectName("CentralWidget")
-        content.layout().addWidget(self._central_widget)
-
-        self._content_hbox = content.layout()
-        return container
-
     def _build_notification_center(self, parent: QWidget) -> None:
         """Constrói o centro de notificações."""
+        from ui.widgets.push_sidebar import PushSidePanel
+        from app.pages.notificacoes import NotificationCenter
+
         self._notif_center = NotificationCenter(self)
         self._notif_panel = PushSidePanel(
             parent=parent,
@@ -174,12 +188,15 @@ class AppShell(FramelessWindow):
 
         # Atualiza badge conforme entradas mudam
         if hasattr(self._notif_center, "countChanged"):
-            self._notif_center.countChanged.connect(self.topbar.setUnreadCountRequested.emit)
+            self._notif_center.countChanged.connect(self.topbar.setUnreadCountRequested)
 
     # ---------------------------------------------------------
     #  Montagem da UI
     # ---------------------------------------------------------
     def _build_central(self, title: str) -> QWidget:
+        from ui.widgets.titlebar import TitleBar
+        from ui.widgets.topbar import TopBar
+
         central = QWidget()
         central.setProperty("role", "content")
         self._central_widget = central  # guardamos para o push panel
@@ -199,13 +216,24 @@ class AppShell(FramelessWindow):
         # Topbar (inicialmente sem título; será atualizado conforme página)
         self.topbar = TopBar(onHamburgerClick=self._toggle_sidebar, title=None)
         self.topbar.breadcrumbClicked.connect(self._go)
-        # Clique no botão de “mais” abre o centro de notificações também
-        try:
-            self.topbar.btn_more.clicked.connect(self.topbar.openNotificationsRequested.emit)  # type: ignore[attr-defined]
-        except Exception:
-            pass
+        # O botão de “mais” já reemite openNotificationsRequested dentro da TopBar
         root_v.addWidget(self.topbar)
 
+        # Setters da TopBar resolvidos uma vez (usados a cada navegação)
+        self._set_topbar_title = self.topbar.set_title
+        self._set_topbar_breadcrumb = self.topbar.set_breadcrumb
+        # Último título/breadcrumb enviados (evita relayout da TopBar sem mudança)
+        self._last_topbar_title: str | None = None
+        self._last_breadcrumb: list[tuple[str, str]] | None = None
+
+        # Barra que recebe o ícone do tema (evita varrer a árvore a cada troca)
+        self._icon_target: QWidget | None = next(
+            (w for w in (self.titlebar, self.topbar) if hasattr(w, "setIcon")), None
+        )
+        if self._icon_target is None:
+            # avisado uma vez aqui; _apply_app_icon só pula a barra (sem busca na árvore)
+            print("[WARN] Nenhuma barra com setIcon: ícone do tema só na janela.")
+
         # Área da Toolbar da página (opcional)
         self.toolbar_area = QFrame(central)
         self.toolbar_area.setObjectName("PageToolbarArea")
@@ -215,6 +243,7 @@ class AppShell(FramelessWindow):
         tb_lay.setContentsMargins(0, 0, 0, 0)
         tb_lay.setSpacing(0)
         self._toolbar_layout = tb_lay
+        self._active_toolbar_widget: QWidget | None = None
         root_v.addWidget(self.toolbar_area)
 
         # Router (conteúdo principal) + espaço para o push sidebar à direita
@@ -246,24 +275,45 @@ class AppShell(FramelessWindow):
     #  Registro de páginas
     # ---------------------------------------------------------
     def register_page(self, route, widget, label=None, show_in_sidebar=True):
-        """Registra uma única página no roteador e sidebar."""
+        """Registra uma única página no roteador e sidebar.
+
+        `widget` pode ser uma factory sem argumentos (página criada na 1ª visita).
+        """
         self.router.register(route, widget)
         if show_in_sidebar:
-            self.sidebar.add_page(route, label or route)
+            self._sidebar_pages.append((route, label or route))
+            if self.sidebar is not None:
+                self.sidebar.add_page(route, label or route)
 
         # Guarda o label (para exibir na TopBar e breadcrumb)
         self._page_labels[route] = label or route
+        # e o widget da página (toolbar resolvida por rota, sem desembrulhar o scroll);
+        # páginas lazy entram aqui pelo _build_page
+        if isinstance(widget, QWidget):
+            self._route_pages[route] = widget
 
     def register_pages(self, specs: Iterable, *, task_runner=None):
         """Registra páginas a partir de uma lista de PageSpecs."""
         self._all_pages = list(specs)
-        for spec in specs:
-            widget = call_with_known_kwargs(
-                spec.factory,
-                task_runner=task_runner,
-                theme_service=self.theme_service,
-            )
-            self.register_page(spec.route, widget, spec.label, spec.sidebar)
+        # dependências montadas uma vez; cada factory recebe só as que aceita
+        deps = {"task_runner": task_runner, "theme_service": self.theme_service}
+        # um único repaint depois do lote (register() adiciona ao QStackedWidget)
+        self.setUpdatesEnabled(False)
+        try:
+            for spec in self._all_pages:
+                if getattr(spec, "lazy", False):
+                    # só rota/label agora; o widget nasce na 1ª navegação
+                    widget = partial(self._build_page, spec.route, spec.factory, deps)
+                else:
+                    widget = call_with_known_kwargs(spec.factory, **deps)
+                self.register_page(spec.route, widget, spec.label, spec.sidebar)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_page(self, route: str, factory, deps: dict) -> QWidget:
+        widget = call_with_known_kwargs(factory, **deps)
+        self._route_pages[route] = widget
+        return widget
 
     # ---------------------------------------------------------
     #  Inicialização (tema + página inicial)
@@ -288,21 +338,15 @@ class AppShell(FramelessWindow):
         if not force_home:
             try:
                 last_route = self.settings.get("nav.last_route")
-                if isinstance(last_route, str) and last_route in self.router._pages:
+                if isinstance(last_route, str) and self.router.has_route(last_route):
                     first_route = last_route
             except Exception:
                 pass
 
-        # Navega para a página inicial/recuperada
+        # Navega para a página inicial/recuperada (o routeChanged define título +
+        # breadcrumb na TopBar e persiste last_route)
         self.router.go(first_route)
 
-        # Define o título + breadcrumb na TopBar e persiste last_route
-        self._update_topbar_for_route(first_route)
-        try:
-            self.settings.set("nav.last_route", first_route)
-        except Exception:
-            pass
-
         # ----- Geometria inicial -----
         try:
             start_max = bool(self.settings.get("window.start_maximized", False))
@@ -336,28 +380,58 @@ class AppShell(FramelessWindow):
     # ---------------------------------------------------------
     #  Ações simples
     # ---------------------------------------------------------
+    def _ensure_settings_panel(self):
+        if self.settings_panel is None:
+            from ui.widgets.settings_sidebar import SettingsSidePanel
+
+            self._settings_widget = self._build_settings_page(theme_service=self.theme_service)
+            self.settings_panel = SettingsSidePanel(
+                parent=self.centralWidget(),
+                content=self._settings_widget,
+                use_scrim=True,
+                close_on_scrim=True,
+            )
+        return self.settings_panel
+
     def _toggle_settings_panel(self):
         try:
-            self.settings_panel.toggle()
+            self._ensure_settings_panel().toggle()
         except Exception as e:  # noqa: BLE001
             print("[ERRO] toggle settings panel:", e)
 
+    def _ensure_sidebar(self):
+        if self.sidebar is None:
+            from ui.widgets.overlay_sidebar import OverlaySidePanel
+
+            self.sidebar = OverlaySidePanel(
+                parent=self.centralWidget(),
+                use_scrim=True,
+                close_on_scrim=True,
+                close_on_select=True
+            )
+            self.sidebar.pageSelected.connect(self._go)
+            self.sidebar.add_pages(self._sidebar_pages)
+        return self.sidebar
+
     def _toggle_sidebar(self):
-        self.sidebar.toggle()
+        self._ensure_sidebar().toggle()
 
     def _go(self, route: str):
-        """Troca de rota e atualiza TopBar/breadcrumb + persistência."""
+        """Troca de rota; TopBar/breadcrumb + persistência vêm do routeChanged."""
         self.router.go(route)
-        self._update_topbar_for_route(route)
-        try:
-            self.settings.set("nav.last_route", route)
-        except Exception:
-            pass
 
     # ---------------------- Router wiring / Topbar helpers ----------------------
 
     def _wire_router_events(self):
         """Conecta eventos do Router para manter TopBar e persistência em sincronia."""
+        # Settings.set grava o JSON inteiro: a última rota só vai pro disco quando
+        # a navegação assenta (back/forward em sequência = uma gravação)
+        self._pending_last_route: str | None = None
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(500)
+        self._persist_timer.setTimerType(Qt.CoarseTimer)
+        self._persist_timer.timeout.connect(self._flush_last_route)
         try:
             self.router.routeChanged.connect(self._on_route_changed)
         except Exception as e:
@@ -366,34 +440,46 @@ class AppShell(FramelessWindow):
     def _on_route_changed(self, path: str, params: dict):
         """Atualiza UI/persistência quando a rota muda (back/forward/go)."""
         self._update_topbar_for_route(path)
-        self._update_toolbar_for_current_page()
+        self._update_toolbar_for_route(path)
+        self._pending_last_route = path
+        self._persist_timer.start()
+
+    def _flush_last_route(self) -> None:
+        self._persist_timer.stop()
+        path, self._pending_last_route = self._pending_last_route, None
+        if path is None:
+            return
         try:
             self.settings.set("nav.last_route", path)
         except Exception:
             pass
 
+    def closeEvent(self, e):
+        # garante a última rota mesmo fechando dentro da janela do debounce
+        self._flush_last_route()
+        super().closeEvent(e)
+
     def _update_topbar_for_route(self, path: str):
         """Atualiza título e breadcrumb simples na TopBar."""
         # Título: label registrado para a rota (fallback = último segmento humanizado)
         label = self._page_labels.get(path)
         if not label:
             label = path.split("/")[-1].replace("-", " ").title()
-        if hasattr(self.topbar, "set_title"):
-            self.topbar.set_title(label)
-
-        # Breadcrumb: partes acumuladas
-        parts = []
-        acc = []
-        for seg in (path or "").split("/"):
-            if not seg:
-                continue
-            acc.append(seg)
-            acc_path = "/".join(acc)
-            seg_label = self._page_labels.get(acc_path) or seg.replace("-", " ").title()
-            parts.append((seg_label, acc_path))
-
-        if hasattr(self.topbar, "set_breadcrumb"):
-            self.topbar.set_breadcrumb(parts if len(parts) > 1 else None)
+        if label != self._last_topbar_title:
+            self._last_topbar_title = label
+            self._set_topbar_title(label)
+
+        # Breadcrumb: prefixos acumulados num único passe
+        segs = [seg for seg in (path or "").split("/") if seg]
+        labels = self._page_labels
+        parts = [
+            (labels.get(acc_path) or seg.replace("-", " ").title(), acc_path)
+            for seg, acc_path in zip(segs, accumulate(segs, "{}/{}".format))
+        ]
+        crumbs = parts if len(parts) > 1 else None
+        if crumbs != self._last_breadcrumb:
+            self._last_breadcrumb = crumbs
+            self._set_topbar_breadcrumb(crumbs)
 
     # ---------------------- Toolbar por página ----------------------
     def set_page_toolbar(self, toolbar: QWidget | None):
@@ -405,6 +491,7 @@ class AppShell(FramelessWindow):
                 w = item.widget()
                 if w:
                     w.setParent(None)
+            self._active_toolbar_widget = toolbar
             if toolbar is not None:
                 lay.addWidget(toolbar)
                 self.toolbar_area.show()
@@ -414,21 +501,13 @@ class AppShell(FramelessWindow):
             print("[WARN] set_page_toolbar falhou:", e)
 
     def _update_toolbar_for_current_page(self):
+        self._update_toolbar_for_route(self.router.current_route)
+
+    def _update_toolbar_for_route(self, route: str | None):
         try:
-            page = self.router.currentWidget()
-            # Se a página estiver embrulhada por um QScrollArea (wrapper global),
-            # desce até o widget real da página para buscar build_toolbar/toolbar.
-            if isinstance(page, QScrollArea):
-                container = page.widget()
-                if container and hasattr(container, "layout") and container.layout() is not None:
-                    lay = container.layout()
-                    # tenta pegar o primeiro widget do layout (página real)
-                    for i in range(lay.count()):
-                        it = lay.itemAt(i)
-                        if it and it.widget():
-                            page = it.widget()
-                            break
-            tb = None
+            # Página real guardada no register_page (antes do QScrollArea do Router):
+            # lookup direto, sem currentWidget() + varredura do layout
+            page = self._route_pages.get(route) if route else None
             if page is not None:
                 # Se a página expõe build_toolbar() retornando um QWidget, usamos
                 build = getattr(page, "build_toolbar", None)
@@ -439,7 +518,7 @@ class AppShell(FramelessWindow):
                     tb = getattr(page, "toolbar", None)
                 self.set_page_toolbar(tb if isinstance(tb, QWidget) else None)
         except Exception as e:
-            print("[WARN] _update_toolbar_for_current_page:", e)
+            print("[WARN] _update_toolbar_for_route:", e)
 
     def _open_quick_open(self):
         """Abre Quick Open (Ctrl+K) frameless, modal e estilizado pelo base.qss."""
@@ -455,76 +534,36 @@ class AppShell(FramelessWindow):
     # ---------------------- Hooks de animação pesada (tema) ----------------------
     def _begin_heavy_anim(self) -> None:
         """Sinaliza animação pesada: suspende cosméticos (toolbar/menus) e hovers."""
-        try:
-            setattr(self, "_is_heavy_anim", True)
-        except Exception:
-            pass
-        # Toolbar por página: pausa hover/timers e desabilita updates
-        try:
-            if hasattr(self, "toolbar_area") and self.toolbar_area is not None:
-                self.toolbar_area.setUpdatesEnabled(False)
-                # tenta localizar widget toolbar no layout
-                tb = None
-                try:
-                    lay = getattr(self, "_toolbar_layout", None)
-                    if lay is not None:
-                        for i in range(lay.count()):
-                            it = lay.itemAt(i)
-                            if it and it.widget():
-                                tb = it.widget(); break
-                except Exception:
-                    tb = None
-                if tb is not None and hasattr(tb, "pause_hover"):
-                    try:
-                        tb.pause_hover(True)  # type: ignore[attr-defined]
-                    except Exception:
-                        pass
-            # Também reduz updates visuais na TitleBar (cosmético)
-            if hasattr(self, "titlebar") and self.titlebar is not None:
-                try:
-                    self.titlebar.setUpdatesEnabled(False)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        self._set_heavy_anim(True)
 
     def _end_heavy_anim(self) -> None:
         """Retoma estado após animação pesada."""
-        try:
-            setattr(self, "_is_heavy_anim", False)
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "toolbar_area") and self.toolbar_area is not None:
-                # tenta localizar toolbar para retomar hover
-                tb = None
-                try:
-                    lay = getattr(self, "_toolbar_layout", None)
-                    if lay is not None:
-                        for i in range(lay.count()):
-                            it = lay.itemAt(i)
-                            if it and it.widget():
-                                tb = it.widget(); break
-                except Exception:
-                    tb = None
-                if tb is not None and hasattr(tb, "pause_hover"):
-                    try:
-                        tb.pause_hover(False)  # type: ignore[attr-defined]
-                    except Exception:
-                        pass
-                # reabilita updates da área visual
-                self.toolbar_area.setUpdatesEnabled(True)
-            if hasattr(self, "titlebar") and self.titlebar is not None:
-                try:
-                    self.titlebar.setUpdatesEnabled(True)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        self._set_heavy_anim(False)
+
+    def _set_heavy_anim(self, on: bool) -> None:
+        self._is_heavy_anim = on
+        if not on and self._icon_update_deferred:
+            self._icon_update_deferred = False
+            self._iconDebounceTimer.start()
+        # Toolbar por página (guardada pelo set_page_toolbar): pausa/retoma hover/timers
+        tb = self._active_toolbar_widget
+        if tb is not None and hasattr(tb, "pause_hover"):
+            try:
+                tb.pause_hover(on)  # type: ignore[attr-defined]
+            except Exception:
+                pass
+        # Área da toolbar e TitleBar são cosméticas: sem repaint durante a interpolação
+        for w in (self.toolbar_area, self.titlebar):
+            try:
+                w.setUpdatesEnabled(not on)
+            except Exception:
+                pass
 
     # ---------------------- Notificações: helpers ----------------------
 
     def _clear_notifications_from_topbar(self):
+        from ui.widgets.toast import notification_bus
+
         try:
             if hasattr(self._notif_center, "clear_finished_public"):
                 self._notif_center.clear_finished_public()  # type: ignore[attr-defined]
@@ -536,97 +575,121 @@ class AppShell(FramelessWindow):
     # ---------------------- ÍCONE DO APP SINCRONIZADO COM TEMA ----------------------
 
     def _setup_theme_icon_sync(self) -> None:
-        # 1) Conecta em sinais do ThemeService (pegamos os mais comuns)
-        try:
-            if hasattr(self, "theme_service"):
-                for sig_name in ("themeApplied", "themeChanged", "paletteChanged", "styleApplied"):
-                    if hasattr(self.theme_service, sig_name):
-                        getattr(self.theme_service, sig_name).connect(self._update_app_icon_for_theme)
-        except Exception as e:
-            print("[WARN] não consegui conectar nos sinais de tema:", e)
-
-        # 2) Observa o arquivo de cache (mesma linha do loading_overlay)
+        # Debounce: rajadas de eventos (sinais de tema em sequência, delete+create,
+        # regravações seguidas) viram uma única atualização quando tudo assenta
+        self._pending_icon_theme: str | None = None
+        self._iconDebounceTimer = QTimer(self)
+        self._iconDebounceTimer.setSingleShot(True)
+        self._iconDebounceTimer.setInterval(150)
+        # debounce não precisa de precisão: não sobe a resolução de timer do SO
+        self._iconDebounceTimer.setTimerType(Qt.CoarseTimer)
+        self._iconDebounceTimer.timeout.connect(self._refresh_app_icon)
+
+        # 1) ThemeService emite themeApplied(nome) uma vez por aplicação de tema
+        self.theme_service.themeApplied.connect(self._schedule_icon_update)
+        # Pasta de temas mudou (tema criado/removido/renomeado): o memo de ícones
+        # pode ter ficado velho; o themeApplied que vem em seguida re-resolve
+        self.theme_service.themesChanged.connect(self._invalidate_icon_cache)
+
+        # 2) Observa o arquivo de cache (mesma linha do loading_overlay): a pasta
+        # sobrevive a salvamentos delete+rename; o arquivo pega escritas no lugar
         try:
             self._iconWatcher = QFileSystemWatcher(self)
             cache_json = self._cache_json_path()
-            if cache_json and cache_json.exists():
-                self._iconWatcher.addPath(str(cache_json))
+            self._iconCacheSig = self._cache_json_sig()
+            if cache_json and cache_json.parent.is_dir():
+                self._iconWatcher.addPath(str(cache_json.parent))
+                if self._iconCacheSig is not None:
+                    self._iconWatcher.addPath(str(cache_json))
+                self._iconWatcher.directoryChanged.connect(self._on_theme_cache_dir_changed)
                 self._iconWatcher.fileChanged.connect(self._on_theme_cache_changed)
         except Exception as e:
             print("[WARN] não consegui observar _ui_exec_settings.json:", e)
 
-        # 3) Aplica já o ícone do tema atual
-        theme_name = self._current_theme_name_safe()
-        self._update_app_icon_for_theme(theme_name)
+        # 3) Aplica o ícone do tema atual na 1ª volta do event loop (após start()),
+        # com as pastas já listadas pelo prefetch
+        QTimer.singleShot(0, self._refresh_app_icon)
 
-    def _on_theme_cache_changed(self, path: str) -> None:
-        # Alguns editores salvam como delete+create → precisamos re-adicionar o path
+    def _cache_json_sig(self) -> tuple[int, int] | None:
+        cj = self._cache_json_path()
         try:
-            if hasattr(self, "_iconWatcher") and self._iconWatcher is not None:
-                files = set(self._iconWatcher.files())
-                if path not in files:
-                    from pathlib import Path as _P
-                    if _P(path).exists():
-                        self._iconWatcher.addPath(path)
-        except Exception:
-            pass
+            st = cj.stat() if cj else None
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size) if st else None
+
+    def _on_theme_cache_dir_changed(self, _dir: str) -> None:
+        # Outros arquivos da pasta também disparam: só segue se o JSON mudou
+        sig = self._cache_json_sig()
+        if sig == self._iconCacheSig:
+            return
+        self._iconCacheSig = sig
+        # delete+create/rename derruba o watch do arquivo → re-adiciona
+        if sig is not None:
+            try:
+                cj = str(self._cache_json_path())
+                if cj not in self._iconWatcher.files():
+                    self._iconWatcher.addPath(cj)
+            except Exception:
+                pass
+        self._iconDebounceTimer.start()
+
+    def _on_theme_cache_changed(self, path: str) -> None:
+        self._iconCacheSig = self._cache_json_sig()
+        # (re)inicia a contagem: só atualiza quando o arquivo terminar de salvar
+        # e o ThemeService tiver atualizado
+        self._iconDebounceTimer.start()
 
-        # pequena espera para o arquivo terminar de salvar e o ThemeService atualizar
-        QTimer.singleShot(25, lambda: self._update_app_icon_for_theme(self._current_theme_name_safe()))
+    def _schedule_icon_update(self, theme_name=None) -> None:
+        """Guarda o último tema sinalizado e (re)inicia o debounce."""
+        if isinstance(theme_name, str) and theme_name:
+            self._pending_icon_theme = theme_name
+        self._iconDebounceTimer.start()
+
+    def _invalidate_icon_cache(self, *_args) -> None:
+        self._icon_path_cache.clear()
+        self._last_icon_key = None
+
+    def _refresh_app_icon(self) -> None:
+        name, self._pending_icon_theme = self._pending_icon_theme, None
+        self._update_app_icon_for_theme(name or self._current_theme_name_safe())
 
     def _current_theme_name_safe(self) -> str:
-        # Preferimos o theme_service; se não existir, caímos num default.
+        # Nome do theme_service; sem tema aplicado, caímos num default.
         try:
-            if hasattr(self, "theme_service"):
-                for attr in ("current_theme_name", "currentThemeName", "themeName"):
-                    if hasattr(self.theme_service, attr):
-                        name = getattr(self.theme_service, attr)
-                        if callable(name):
-                            name = name()
-                        if name:
-                            return str(name)
+            name = self._theme_name_getter()
         except Exception:
-            pass
-        return "default"
+            return "default"
+        return str(name) if name else "default"
 
     def _slugify(self, name: str) -> str:
-        import re, unicodedata
-        s = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii")
-        s = re.sub(r"[^a-zA-Z0-9]+", "-", s).strip("-").lower()
-        return s or "default"
+        return _slugify(name or "")
 
     def _theme_slug_candidates(self, theme_name: str) -> list[str]:
         """
         Gera uma lista de possíveis slugs para o tema, incluindo o que está no JSON
         usado pelo loading_overlay (cache/_ui_exec_settings.json).
         """
-        def slugify(s: str) -> str:
-            import re, unicodedata
-            s2 = unicodedata.normalize("NFKD", s or "").encode("ascii", "ignore").decode("ascii")
-            s2 = re.sub(r"[^a-zA-Z0-9]+", "-", s2).strip("-").lower()
-            return s2 or "default"
-
         cands: list[str] = []
 
         # 1) do ThemeService
         if theme_name:
             raw = str(theme_name)
             cands += [
-                slugify(raw),
+                _slugify(raw),
                 raw.strip().lower().replace(" ", "-"),
                 raw.strip().lower().replace(" ", "_"),
             ]
 
         # 2) do JSON do cache (igual ao loading_overlay)
         try:
-            cj = self._cache_json_path()
-            if cj and cj.exists():
-                data = json.loads(cj.read_text(encoding="utf-8", errors="ignore"))
+            data = self._load_cache_json()
+            if data:
                 for key in ("theme", "current_theme", "theme_key", "ui_theme", "selected_theme"):
                     v = data.get(key)
                     if isinstance(v, str):
                         cands += [
-                            slugify(v),
+                            _slugify(v),
                             v.strip().lower().replace(" ", "-"),
                             v.strip().lower().replace(" ", "_"),
                         ]
@@ -645,7 +708,35 @@ class AppShell(FramelessWindow):
 
         return out
 
-    def _assets_roots(self) -> list[Path]:
+    def _load_cache_json(self) -> dict | None:
+        """Lê o JSON de cache; só re-parseia quando (mtime, tamanho) mudar."""
+        cj = self._cache_json_path()
+        if not cj:
+            return None
+        try:
+            st = cj.stat()
+        except OSError:
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        cached = self._cache_json_cached
+        if cached and cached[0] == sig:
+            return cached[1]
+        # JSON inválido (ex.: lido no meio de uma gravação) também fica em cache
+        # até o arquivo mudar: não re-lê/re-parseia a cada chamada
+        try:
+            data = json.loads(cj.read_bytes().decode("utf-8", "ignore"))
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict):
+            data = None
+        self._cache_json_cached = (sig, data)
+        return data
+
+    def _assets_roots(self) -> tuple[Path, ...]:
+        """Raízes de ícones calculadas no __init__ (ver _compute_assets_roots)."""
+        return self._assets_roots_tuple
+
+    def _compute_assets_roots(self) -> list[Path]:
         """
         Raízes onde procurar ícones:
         - settings.assets_dir / settings.icons_dir (se existirem)
@@ -671,17 +762,29 @@ class AppShell(FramelessWindow):
         cwd = Path.cwd()
         roots.extend([cwd / "assets", cwd / "app" / "assets"])
 
-        # unique preservando ordem
-        seen, out = set(), []
+        # unique preservando ordem (chave str: evita o hash de Path); raízes
+        # repetidas nem chegam ao resolve()
+        seen_raw: set[str] = set()
+        seen: set[str] = set()
+        out: list[Path] = []
         for r in roots:
+            raw = str(r)
+            if raw in seen_raw:
+                continue
+            seen_raw.add(raw)
             rp = r.resolve()
-            if rp not in seen:
+            key = str(rp)
+            if key not in seen:
                 out.append(rp)
-                seen.add(rp)
+                seen.add(key)
 
         return out
 
     def _cache_json_path(self) -> Path | None:
+        """Caminho do JSON de cache resolvido no __init__ (ver _compute_cache_json_path)."""
+        return self._cache_json_file
+
+    def _compute_cache_json_path(self) -> Path | None:
         try:
             if hasattr(self, "settings") and hasattr(self.settings, "cache_dir"):
                 p = Path(self.settings.cache_dir) / "_ui_exec_settings.json"
@@ -699,8 +802,23 @@ class AppShell(FramelessWindow):
         return candidatos[0]
 
     def _resolve_app_icon_path(self, theme_name: str) -> Path | None:
-        slugs = self._theme_slug_candidates(theme_name)
+        # memo pelos slugs (não só pelo nome: o JSON de cache também contribui);
+        # não pela assinatura do JSON, que muda a cada gravação do Settings
+        slugs = tuple(self._theme_slug_candidates(theme_name))
+        roots = self._assets_roots()
+        if roots != self._icon_cache_roots:
+            self._icon_path_cache.clear()
+            self._icon_cache_roots = roots
+        try:
+            return self._icon_path_cache[slugs]
+        except KeyError:
+            pass
+        path = self._probe_app_icon_path(slugs)
+        self._icon_path_cache[slugs] = path
+        return path
 
+    def _probe_app_icon_path(self, slugs: tuple[str, ...]) -> Path | None:
+        """Procura o ícone no disco (sem cache)."""
         def name_candidates(s: str) -> list[str]:
             return [
                 f"app_{s}.ico", f"app-{s}.ico", f"{s}_app.ico",
@@ -710,34 +828,45 @@ class AppShell(FramelessWindow):
                 f"{s}.png", f"icon_{s}.png",
             ]
 
-        def dir_candidates(root: Path, s: str) -> list[Path]:
+        join = os.path.join
+
+        def dir_candidates(root: str, s: str) -> list[str]:
             return [
-                root / "icons",
-                root / "icons" / "themes",
-                root / "icons" / "app",
+                join(root, "icons"),
+                join(root, "icons", "themes"),
+                join(root, "icons", "app"),
                 root,  # direto na raiz dos assets
                 # pastas com o nome do tema (icons/aku/app.ico)
-                root / "icons" / s,
-                root / "icons" / "themes" / s,
+                join(root, "icons", s),
+                join(root, "icons", "themes", s),
             ]
 
-        for root in self._assets_roots():
+        # um scandir por pasta + teste em set (normcase: Windows ignora maiúsculas);
+        # tudo em str, só o acerto vira Path
+        norm = os.path.normcase
+        names_by_slug = {s: [(nm, norm(nm)) for nm in name_candidates(s)] for s in slugs}
+        roots = [str(r) for r in self._assets_roots()]
+        for root in roots:
             for s in slugs:
+                names = names_by_slug[s]
                 for d in dir_candidates(root, s):
-                    for nm in name_candidates(s):
-                        p = d / nm
-                        if p.exists():
-                            return p
+                    files = _dir_files(d)
+                    if not files:
+                        continue
+                    for nm, key in names:
+                        if key in files:
+                            return Path(d, nm)
 
         # último fallback: app.ico/png genérico
-        for root in self._assets_roots():
+        for root in roots:
+            icons_dir = join(root, "icons")
+            icons_files = _dir_files(icons_dir)
+            root_files = _dir_files(root)
             for generic in ("app.ico", "app.png", "icon.ico", "icon.png"):
-                p = (root / "icons" / generic)
-                if p.exists():
-                    return p
-                p2 = root / generic
-                if p2.exists():
-                    return p2
+                if norm(generic) in icons_files:
+                    return Path(icons_dir, generic)
+                if norm(generic) in root_files:
+                    return Path(root, generic)
 
         return None
 
@@ -745,54 +874,70 @@ class AppShell(FramelessWindow):
         if not icon_path:
             return
         try:
-            icon = QIcon(str(icon_path))
+            # QIcon compartilhado por caminho (cache do safe_icon): não redecodifica o .ico
+            icon = safe_icon(icon_path)
+            if icon is None:
+                return
 
-            # 1) janela (Alt-Tab e parte da taskbar em vários SOs)
-            self.setWindowIcon(icon)
+            # 1) janela (Alt-Tab e parte da taskbar em vários SOs); mesmo QIcon
+            # (cacheKey igual) não refaz a ida ao gerenciador de janelas
+            if self.windowIcon().cacheKey() != icon.cacheKey():
+                self.setWindowIcon(icon)
 
-            # 2) aplicação (ícone da taskbar no Windows/Linux tende a seguir este)
+            # 2) aplicação (ícone da taskbar no Windows/Linux tende a seguir este);
+            # só notifica o app inteiro se o ícone for outro
             try:
-                QApplication.setWindowIcon(icon)
+                if QApplication.windowIcon().cacheKey() != icon.cacheKey():
+                    QApplication.setWindowIcon(icon)
             except Exception:
                 pass
 
-            # 2.1) empurrão no próximo ciclo (ajuda no Windows teimoso)
-            QTimer.singleShot(0, lambda: self.setWindowIcon(icon))
+            # 2.1) empurrão no próximo ciclo (ajuda no Windows teimoso); só na 1ª
+            # aplicação, quando a janela nativa ainda está sendo criada
+            if _WIN and self._last_applied_icon is None:
+                self._pending_icon = icon
+                QTimer.singleShot(0, self._apply_pending_icon)
 
-            # 3) TitleBar (sem depender do nome exato do atributo)
-            for attr in ("titlebar", "topbar", "title_bar", "header", "appbar"):
-                bar = getattr(self, attr, None)
-                if bar and hasattr(bar, "setIcon"):
-                    try:
-                        bar.setIcon(icon)  # TitleBar já anima
-                        break
-                    except Exception:
-                        pass
-            else:
-                # 3b) fallback: procura por children com API setIcon
-                for w in self.findChildren(QWidget):
-                    try:
-                        if w.objectName() in ("TitleBar", "titlebar") and hasattr(w, "setIcon"):
-                            w.setIcon(icon)
-                            break
-                    except Exception:
-                        pass
+            # 3) TitleBar (resolvida em _build_central); erro cai no try externo
+            if self._icon_target is not None:
+                self._icon_target.setIcon(icon)  # TitleBar já anima
 
+            self._last_applied_icon = icon_path
         except Exception as e:
             print("[WARN] Falha ao aplicar ícone:", e)
 
+    def _apply_pending_icon(self) -> None:
+        icon, self._pending_icon = self._pending_icon, None
+        if icon is not None:
+            self.setWindowIcon(icon)
+
     def _update_app_icon_for_theme(self, theme_name: str | None) -> None:
         """Resolve arquivo do ícone para o tema e aplica."""
         try:
             # Evita I/O/varreduras durante a interpolação de tema
-            if getattr(self, "_is_heavy_anim", False):
-                # reagenda para depois (evita loop: flag será baixada no finished())
-                QTimer.singleShot(60, lambda: self._update_app_icon_for_theme(theme_name))
+            if self._is_heavy_anim:
+                # sem timer: só guarda o pedido; _end_heavy_anim dispara uma vez no fim
+                if theme_name:
+                    self._pending_icon_theme = theme_name
+                self._icon_update_deferred = True
                 return
 
             if not theme_name:
                 theme_name = self._current_theme_name_safe()
+            # mesmo tema e mesmo JSON de cache da última vez: nada pode ter mudado
+            # (o nome sozinho não basta: o JSON também contribui com slugs)
+            key = (theme_name, self._cache_json_sig())
+            if key == self._last_icon_key:
+                return
             path = self._resolve_app_icon_path(theme_name)
+            # sem ícone ou mesmo ícone já aplicado (evento coalescido que não mudou
+            # nada): sem trabalho Qt
+            if path is None or path == self._last_applied_icon:
+                self._last_icon_key = key
+                return
             self._apply_app_icon(path)
+            # só memoriza a chave se aplicou de fato: falha tenta de novo na próxima
+            if self._last_applied_icon == path:
+                self._last_icon_key = key
         except Exception as e:
             print("[WARN] Falha em _update_app_icon_for_tema:", e)
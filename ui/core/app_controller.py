@@ -8,10 +8,10 @@ from typing import Iterable, List, Optional
 
 from ui.services.task_runner_adapter import TaskRunnerAdapter
 from .app import AppShell
-from app.pages.registry import load_from_manifest, discover_pages
+from app.pages.registry import PageSpec, load_from_manifest, discover_pages
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControllerConfig:
     assets_dir: Path
     themes_dir: Path
@@ -22,16 +22,18 @@ class ControllerConfig:
     manifest_filename: str
 
 
-def _merge_specs(primary: Iterable, fallback: Iterable) -> List:
+def _spec_sort_key(spec: PageSpec) -> tuple:
+    # (order, label); sem label, cai na route
+    return (spec.order, spec.label or spec.route)
+
+
+def _merge_specs(primary: Iterable[PageSpec], fallback: Iterable[PageSpec]) -> List[PageSpec]:
     # primary (manifest) tem prioridade; dedup por route; ordena por (order, label)
-    by_route = {}
-    for spec in fallback:
-        by_route[getattr(spec, "route", "")] = spec
-    for spec in primary:
-        by_route[getattr(spec, "route", "")] = spec  # override
-    merged = list(by_route.values())
-    merged.sort(key=lambda s: (getattr(s, "order", 1000), getattr(s, "label", getattr(s, "route", ""))))
-    return merged
+    by_route = {spec.route: spec for spec in fallback}
+    by_route.update((spec.route, spec) for spec in primary)  # override
+    # sort com key= calcula a chave uma vez por spec e é estável (nunca compara
+    # os specs em si)
+    return sorted(by_route.values(), key=_spec_sort_key)
 
 
 class AppController:
@@ -68,11 +70,12 @@ class AppController:
         self.settings = settings
         self.task_runner_adapter = TaskRunnerAdapter(task_runner) if task_runner else None
 
+        # AppShell recebe as strings originais (sem ida e volta str → Path → str)
         self.shell = AppShell(
             title=self.cfg.app_title,
-            assets_dir=str(self.cfg.assets_dir),
-            themes_dir=str(self.cfg.themes_dir),
-            base_qss_path=str(self.cfg.base_qss_path),
+            assets_dir=str(assets_dir),
+            themes_dir=str(themes_dir),
+            base_qss_path=str(base_qss_path),
             settings=self.settings,
         )
 
@@ -85,7 +88,7 @@ class AppController:
     # ----- ciclo de páginas -----
     def _init_pages(self):
         manifest_path = self.cfg.assets_dir / self.cfg.manifest_filename
-        from_manifest = load_from_manifest(manifest_path) if manifest_path.exists() else []
+        from_manifest = load_from_manifest(manifest_path, missing_ok=True)
         auto = discover_pages()
         specs = _merge_specs(from_manifest, auto)
         self.shell.register_pages(specs, task_runner=self.task_runner_adapter)
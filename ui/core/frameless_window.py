@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 from typing import Optional, Callable, Iterable
+from time import monotonic
+from weakref import WeakSet
 
 from PySide6.QtCore import (
     Qt, QRect, QPoint, QEasingCurve, QPropertyAnimation, QEvent, QSize, QObject,
-    QParallelAnimationGroup, QSequentialAnimationGroup, QTimer, QEventLoop,
+    QParallelAnimationGroup, QSequentialAnimationGroup, QTimer, QEventLoop, QVariantAnimation,
+    QAbstractAnimation,
 )
 from PySide6.QtGui import (
     QMouseEvent, QKeySequence, QCursor, QShortcut, QGuiApplication, QWheelEvent,
@@ -30,6 +33,35 @@ class _Fx:
     SNAP_THRESHOLD      = 24
     GEO_MS_DEFAULT      = 340
     FADE_MS_DEFAULT     = 200
+    RESIZE_MIN_MS       = 8     # intervalo mínimo entre setGeometry no live-resize
+
+
+# Bordas de resize como bitmask (left | top | right | bottom)
+_EDGE_L, _EDGE_T, _EDGE_R, _EDGE_B = 1, 2, 4, 8
+
+
+def _cursor_for_edges(mask: int):
+    if (mask & _EDGE_L and mask & _EDGE_T) or (mask & _EDGE_R and mask & _EDGE_B):
+        return Qt.SizeFDiagCursor
+    if (mask & _EDGE_R and mask & _EDGE_T) or (mask & _EDGE_L and mask & _EDGE_B):
+        return Qt.SizeBDiagCursor
+    if mask & (_EDGE_L | _EDGE_R):
+        return Qt.SizeHorCursor
+    if mask & (_EDGE_T | _EDGE_B):
+        return Qt.SizeVerCursor
+    return None
+
+
+# cursor por combinação de bordas (None => cursor padrão)
+_CURSOR_BY_MASK = tuple(_cursor_for_edges(m) for m in range(16))
+
+# únicos tipos que o eventFilter trata; o resto (Paint, UpdateRequest, Timer,
+# LayoutRequest, Move/Resize, foco...) sai na primeira linha
+_INTERESTING = frozenset({
+    QEvent.ChildAdded, QEvent.Wheel,
+    QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.MouseButtonRelease,
+    QEvent.MouseButtonDblClick, QEvent.HoverMove, QEvent.HoverLeave, QEvent.Leave,
+})
 
 
 # =============================================================================
@@ -50,10 +82,44 @@ class FramelessWindow(QMainWindow):
         # Estado interno
         self._titlebars: list[QWidget] = []
         self._draggables: list[QWidget] = []
+        # membership por id() (O(1) no eventFilter); as listas seguram as refs
+        # Python, então o id não é reciclado enquanto o widget está registrado
+        self._titlebar_ids: set[int] = set()
+        self._draggables_ids: set[int] = set()
+        # eventFilter: tipo do evento -> handler (draggables / bordas de resize).
+        # HoverMove/Leave de draggables caem na tabela de bordas, que faz o mesmo.
+        self._drag_handlers = {
+            QEvent.MouseButtonPress: self._on_drag_press,
+            QEvent.MouseMove: self._on_drag_move,
+            QEvent.MouseButtonRelease: self._on_drag_release,
+            QEvent.MouseButtonDblClick: self._on_drag_dblclick,
+        }
+        self._edge_handlers = {
+            QEvent.MouseMove: self._on_edge_move,
+            QEvent.HoverMove: self._on_edge_move,
+            QEvent.MouseButtonPress: self._on_edge_press,
+            QEvent.MouseButtonRelease: self._on_edge_release,
+            QEvent.Leave: self._on_edge_leave,
+            QEvent.HoverLeave: self._on_edge_leave,
+        }
+        # widgets que já têm o filtro: subárvores vistas não são percorridas de novo
+        self._watched: WeakSet[QWidget] = WeakSet()
 
         self._resizing = False
         self._resize_pos = QPoint()
-        self._resize_edges = (False, False, False, False)  # left, top, right, bottom
+        # live-resize em lote: deltas acumulam e viram um setGeometry por ciclo
+        self._pending_resize_delta = QPoint()
+        self._resize_scheduled = False
+        self._last_resize_flush = 0.0
+        self._resize_edges = 0  # bitmask _EDGE_*
+        # tamanho da janela em ints (atualizado em resizeEvent/showEvent): o
+        # hit-test de borda roda a cada HoverMove e não deve alocar QRect
+        self._cached_w = self.width()
+        self._cached_h = self.height()
+        self._cursor_shape = None  # cursor de resize aplicado (None = padrão)
+        # hover coalescido: só a última posição do frame vira _update_cursor
+        self._pending_hover_pos: Optional[QPoint] = None
+        self._hover_scheduled = False
 
         self._dragging = False
         self._drag_pos = QPoint()
@@ -69,9 +135,12 @@ class FramelessWindow(QMainWindow):
         self._min_resize_w = 1
         self._min_resize_h = 1
 
-        self._geo_anim: Optional[QPropertyAnimation] = None
+        self._geo_anim: Optional[QAbstractAnimation] = None
         self._fade_anim: Optional[QPropertyAnimation] = None
-        self._anim_refs: list[QObject] = []  # guarda refs para grupos/anim
+        self._anim_refs: dict[int, QObject] = {}  # guarda refs para grupos/anim (por id)
+        # geometria animada: último valor do tick, aplicado uma vez por ciclo
+        self._pending_anim_geo: Optional[QRect] = None
+        self._anim_geo_scheduled = False
 
         self._geo_ms = _Fx.GEO_MS_DEFAULT
         self._fade_ms = _Fx.FADE_MS_DEFAULT
@@ -173,6 +242,7 @@ class FramelessWindow(QMainWindow):
     # ============================================================ lifecycle UI
     def showEvent(self, e):
         self._ensure_shadow()
+        self._cached_w, self._cached_h = self.width(), self.height()
         super().showEvent(e)
         # Animação de primeira abertura (uma única vez)
         if not self._first_show_done:
@@ -238,7 +308,8 @@ class FramelessWindow(QMainWindow):
     def connect_titlebar(self, titlebar_widget: QWidget):
         """Marca um widget como área de drag e conecta botões padrão."""
         self.register_draggable(titlebar_widget)
-        if titlebar_widget not in self._titlebars:
+        if id(titlebar_widget) not in self._titlebar_ids:
+            self._titlebar_ids.add(id(titlebar_widget))
             self._titlebars.append(titlebar_widget)
 
         # Conecta sinais (se existirem)
@@ -258,16 +329,38 @@ class FramelessWindow(QMainWindow):
 
     def register_draggable(self, w: QWidget):
         """Qualquer widget registrado aqui passa a arrastar a janela."""
-        if w not in self._draggables:
+        wid = id(w)
+        if wid not in self._draggables_ids:
+            self._draggables_ids.add(wid)
             self._draggables.append(w)
+            try:
+                w.destroyed.connect(lambda *_: self._forget_draggable(wid))
+            except Exception:
+                pass
             self._watch_widget_tree(w)
 
+    def _forget_draggable(self, wid: int):
+        # widget destruído: tira dos sets antes que o id possa ser reciclado
+        self._draggables_ids.discard(wid)
+        self._draggables = [d for d in self._draggables if id(d) != wid]
+        if wid in self._titlebar_ids:
+            self._titlebar_ids.discard(wid)
+            self._titlebars = [tb for tb in self._titlebars if id(tb) != wid]
+
     # -------------------------------------------------------------- watcher/hit
     def _watch_widget_tree(self, root: QWidget):
-        """Instala filtros e habilita hover/mouseTracking recursivamente."""
+        """Instala filtros e habilita hover/mouseTracking recursivamente.
+
+        Subárvores já observadas são puladas: filhos novos delas chegam pelo
+        ChildAdded do eventFilter.
+        """
+        watched = self._watched
         stack: list[QWidget] = [root]
         while stack:
             obj = stack.pop()
+            if obj in watched:
+                continue
+            watched.add(obj)
             obj.setAttribute(Qt.WA_Hover, True)
             obj.setMouseTracking(True)
             obj.installEventFilter(self)
@@ -276,58 +369,50 @@ class FramelessWindow(QMainWindow):
                     stack.append(child)
 
     def _edge_hit(self, pos: QPoint) -> bool:
-        l, t, r, b = self._calc_edges(pos)
-        return any((l, t, r, b))
+        return self._calc_edges(pos) != 0
 
     def _top_resize_hit(self, pos: QPoint) -> bool:
         if self._is_maximized or not self._edges_enabled:
             return False
         return pos.y() <= max(_Fx.RESIZE_MARGIN, _Fx.TITLEBAR_DRAG_GAP)
 
-    def _calc_edges(self, pos: QPoint) -> tuple[bool, bool, bool, bool]:
-        """Retorna (left, top, right, bottom) se pos está em regiões de resize."""
+    def _calc_edges(self, pos: QPoint) -> int:
+        """Retorna o bitmask _EDGE_* das regiões de resize sob pos (0 = nenhuma)."""
         if self._is_maximized or not self._edges_enabled:
-            return (False, False, False, False)
+            return 0
 
-        r = self.rect()
-        left   = pos.x() <= _Fx.RESIZE_MARGIN
-        right  = pos.x() >= r.width()  - _Fx.RESIZE_MARGIN
-        top    = pos.y() <= _Fx.RESIZE_MARGIN
-        bottom = pos.y() >= r.height() - _Fx.RESIZE_MARGIN
+        x, y = pos.x(), pos.y()
+        w, h = self._cached_w, self._cached_h
 
-        near_left   = pos.x() <= _Fx.CORNER_MARGIN
-        near_right  = pos.x() >= r.width()  - _Fx.CORNER_MARGIN
-        near_top    = pos.y() <= _Fx.CORNER_MARGIN
-        near_bottom = pos.y() >= r.height() - _Fx.CORNER_MARGIN
+        # diagonais antes — melhora UX (cantos usam a margem maior)
+        m = _Fx.CORNER_MARGIN
+        near = (x <= m) | (y <= m) << 1 | (x >= w - m) << 2 | (y >= h - m) << 3
+        if near & (_EDGE_L | _EDGE_R) and near & (_EDGE_T | _EDGE_B):
+            return near
 
-        # diagonais antes — melhora UX
-        if (near_left and near_top) or (near_right and near_bottom):
-            return (near_left, near_top, near_right, near_bottom)
-        if (near_right and near_top) or (near_left and near_bottom):
-            return (near_left, near_top, near_right, near_bottom)
+        m = _Fx.RESIZE_MARGIN
+        return (x <= m) | (y <= m) << 1 | (x >= w - m) << 2 | (y >= h - m) << 3
 
-        return left, top, right, bottom
+    def _set_edge_cursor(self, shape) -> None:
+        # só fala com o sistema de janelas quando o cursor muda de fato
+        if shape is self._cursor_shape:
+            return
+        self._cursor_shape = shape
+        if shape is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(shape)
 
     def _update_cursor(self, pos: QPoint):
         if self._heavy_animating or self._is_maximized:
             return
-        left, top, right, bottom = self._calc_edges(pos)
-        if (left and top) or (right and bottom):
-            self.setCursor(Qt.SizeFDiagCursor)
-        elif (right and top) or (left and bottom):
-            self.setCursor(Qt.SizeBDiagCursor)
-        elif left or right:
-            self.setCursor(Qt.SizeHorCursor)
-        elif top or bottom:
-            self.setCursor(Qt.SizeVerCursor)
-        else:
-            self.unsetCursor()
+        self._set_edge_cursor(_CURSOR_BY_MASK[self._calc_edges(pos)])
 
     def _start_resize_from_edges(self, win_pos: QPoint):
         edges = self._calc_edges(win_pos)
-        if not any(edges):
+        if not edges:
             if _Fx.TOP_RESIZE_PRIORITY and self._top_resize_hit(win_pos):
-                edges = (False, True, False, False)
+                edges = _EDGE_T
             else:
                 return
         self._resizing = True
@@ -336,121 +421,159 @@ class FramelessWindow(QMainWindow):
 
     # ----------------------------------------------------------------- filters
     def eventFilter(self, obj: QObject, ev):
+        t = ev.type()
+        if t not in _INTERESTING:
+            return False
+
         # SHIFT + scroll do mouse => mover scrollbar horizontal
-        if ev.type() == QEvent.Wheel:
-            try:
-                we: QWheelEvent = ev  # type: ignore
-                if we.modifiers() & Qt.ShiftModifier:
-                    # encontra um ancestral com barras de rolagem
-                    w = obj if hasattr(obj, 'horizontalScrollBar') else None
-                    if w is None and isinstance(obj, QWidget):
-                        p = obj.parentWidget()
-                        while p is not None and not hasattr(p, 'horizontalScrollBar'):
-                            p = p.parentWidget()
-                        w = p
-                    if w is not None and hasattr(w, 'horizontalScrollBar'):
-                        try:
-                            hbar = w.horizontalScrollBar()
-                            if hbar is not None:
-                                dv = int(we.angleDelta().y())
-                                if dv != 0:
-                                    hbar.setValue(hbar.value() - dv)
-                                    return True
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+        if t == QEvent.Wheel:
+            if self._on_shift_wheel(obj, ev):
+                return True
 
         # novos filhos => manter hover/resize funcionando
-        if ev.type() == QEvent.ChildAdded:
+        elif t == QEvent.ChildAdded:
             child = ev.child()
             if isinstance(child, QWidget):
                 self._watch_widget_tree(child)
 
-        # --- Draggables (TitleBar etc.)
-        if obj in self._draggables:
-            if ev.type() == QEvent.MouseButtonPress:
-                me: QMouseEvent = ev  # type: ignore
-                if me.button() == Qt.LeftButton:
-                    win_pos = self.mapFromGlobal(me.globalPosition().toPoint())
-                    if self._top_resize_hit(win_pos) and not self._is_maximized:
-                        self._start_resize_from_edges(win_pos); return True
-                    self._dragging = True
-                    self._drag_press_global = me.globalPosition().toPoint()
-                    if not self._is_maximized:
-                        self._drag_pos = self._drag_press_global - self.frameGeometry().topLeft()
-                    obj.setCursor(Qt.SizeAllCursor)
-                    return True
-
-            elif ev.type() == QEvent.MouseMove:
-                me: QMouseEvent = ev  # type: ignore
-                if self._resizing:
-                    delta = me.globalPosition().toPoint() - self._resize_pos
-                    self._perform_resize(delta)
-                    self._resize_pos = me.globalPosition().toPoint()
-                    return True
-
-                if self._dragging:
-                    gpos = me.globalPosition().toPoint()
-                    if self._is_maximized and (gpos - self._drag_press_global).manhattanLength() > _Fx.DRAG_RESTORE_THRESH:
-                        self._restore_from_max_at_cursor(gpos); return True
-                    if not self._is_maximized:
-                        self.move(gpos - self._drag_pos); return True
-
-            elif ev.type() == QEvent.MouseButtonRelease:
-                if self._dragging:
-                    self._handle_snap_under_cursor()
-                self._dragging = False
-                obj.unsetCursor()
-                return False
-
-            elif ev.type() == QEvent.MouseButtonDblClick:
-                self.toggle_max_restore(); return True
-
-            elif ev.type() in (QEvent.Leave, QEvent.HoverLeave):
-                self.unsetCursor()
-
-            elif ev.type() in (QEvent.HoverMove,):
-                hpos = self.mapFromGlobal(QCursor.pos())
-                self._update_cursor(hpos)
-
-        # --- Resize / cursor update (frame/conteúdo/draggables)
-        if obj in (self._frame, self._content) or obj in self._draggables:
-            if ev.type() in (QEvent.MouseMove, QEvent.HoverMove):
-                if self._heavy_animating:
-                    return False
-                gpos = QCursor.pos() if ev.type() == QEvent.HoverMove else ev.globalPosition().toPoint()  # type: ignore
-                if self._resizing:
-                    delta = gpos - self._resize_pos
-                    self._perform_resize(delta)
-                    self._resize_pos = gpos
-                    return True
-                else:
-                    win_pos = self.mapFromGlobal(gpos)
-                    self._update_cursor(win_pos)
-                    return False
+        else:
+            # tipo -> handler por dict (sem cascata de if/elif por evento)
+            is_drag = id(obj) in self._draggables_ids
+
+            # --- Draggables (TitleBar etc.)
+            if is_drag:
+                h = self._drag_handlers.get(t)
+                if h is not None:
+                    res = h(obj, ev)
+                    if res is not None:
+                        return res
+
+            # --- Resize / cursor update (frame/conteúdo/draggables)
+            if is_drag or obj is self._frame or obj is self._content:
+                h = self._edge_handlers.get(t)
+                if h is not None:
+                    res = h(obj, ev)
+                    if res is not None:
+                        return res
 
-            elif ev.type() == QEvent.MouseButtonPress:
-                me: QMouseEvent = ev  # type: ignore
-                if me.button() == Qt.LeftButton and not self._is_maximized:
-                    win_pos = self.mapFromGlobal(me.globalPosition().toPoint())
-                    if self._edge_hit(win_pos):
-                        self._start_resize_from_edges(win_pos); return True
+        return super().eventFilter(obj, ev)
 
-            elif ev.type() == QEvent.MouseButtonRelease:
-                if self._resizing:
-                    self._resizing = False; return True
+    def _on_shift_wheel(self, obj: QObject, ev) -> bool:
+        try:
+            we: QWheelEvent = ev  # type: ignore
+            if we.modifiers() & Qt.ShiftModifier:
+                # encontra um ancestral com barras de rolagem
+                w = obj if hasattr(obj, 'horizontalScrollBar') else None
+                if w is None and isinstance(obj, QWidget):
+                    p = obj.parentWidget()
+                    while p is not None and not hasattr(p, 'horizontalScrollBar'):
+                        p = p.parentWidget()
+                    w = p
+                if w is not None and hasattr(w, 'horizontalScrollBar'):
+                    try:
+                        hbar = w.horizontalScrollBar()
+                        if hbar is not None:
+                            dv = int(we.angleDelta().y())
+                            if dv != 0:
+                                hbar.setValue(hbar.value() - dv)
+                                return True
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+        return False
+
+    # handlers: None => segue para a próxima tabela / super(); bool => retorno do filtro
+    def _on_drag_press(self, obj: QWidget, ev) -> Optional[bool]:
+        me: QMouseEvent = ev  # type: ignore
+        if me.button() != Qt.LeftButton:
+            return None
+        win_pos = self.mapFromGlobal(me.globalPosition().toPoint())
+        if self._top_resize_hit(win_pos) and not self._is_maximized:
+            self._start_resize_from_edges(win_pos); return True
+        self._dragging = True
+        self._drag_press_global = me.globalPosition().toPoint()
+        if not self._is_maximized:
+            self._drag_pos = self._drag_press_global - self.frameGeometry().topLeft()
+        obj.setCursor(Qt.SizeAllCursor)
+        return True
 
-            elif ev.type() in (QEvent.Leave, QEvent.HoverLeave):
-                self.unsetCursor()
+    def _on_drag_move(self, obj: QWidget, ev) -> Optional[bool]:
+        me: QMouseEvent = ev  # type: ignore
+        if self._resizing:
+            delta = me.globalPosition().toPoint() - self._resize_pos
+            self._queue_resize(delta)
+            self._resize_pos = me.globalPosition().toPoint()
+            return True
 
-        return super().eventFilter(obj, ev)
+        if self._dragging:
+            gpos = me.globalPosition().toPoint()
+            if self._is_maximized and (gpos - self._drag_press_global).manhattanLength() > _Fx.DRAG_RESTORE_THRESH:
+                self._restore_from_max_at_cursor(gpos); return True
+            if not self._is_maximized:
+                self.move(gpos - self._drag_pos); return True
+        return None
+
+    def _on_drag_release(self, obj: QWidget, ev) -> Optional[bool]:
+        if self._dragging:
+            self._handle_snap_under_cursor()
+        self._dragging = False
+        obj.unsetCursor()
+        return False
+
+    def _on_drag_dblclick(self, obj: QWidget, ev) -> Optional[bool]:
+        self.toggle_max_restore()
+        return True
+
+    def _on_edge_move(self, obj: QWidget, ev) -> Optional[bool]:
+        if self._heavy_animating:
+            return False
+        gpos = QCursor.pos() if ev.type() == QEvent.HoverMove else ev.globalPosition().toPoint()  # type: ignore
+        if self._resizing:
+            delta = gpos - self._resize_pos
+            self._queue_resize(delta)
+            self._resize_pos = gpos
+            return True
+        self._schedule_hover(gpos)
+        return False
+
+    def _on_edge_press(self, obj: QWidget, ev) -> Optional[bool]:
+        me: QMouseEvent = ev  # type: ignore
+        if me.button() == Qt.LeftButton and not self._is_maximized:
+            win_pos = self.mapFromGlobal(me.globalPosition().toPoint())
+            if self._edge_hit(win_pos):
+                self._start_resize_from_edges(win_pos); return True
+        return None
+
+    def _on_edge_release(self, obj: QWidget, ev) -> Optional[bool]:
+        if self._resizing:
+            self._resizing = False; return True
+        return None
+
+    def _on_edge_leave(self, obj: QWidget, ev) -> Optional[bool]:
+        self._pending_hover_pos = None
+        self._set_edge_cursor(None)
+        return None
+
+    def _schedule_hover(self, gpos: QPoint):
+        # vários Hover/MouseMove no mesmo ciclo do event loop => um _update_cursor
+        self._pending_hover_pos = gpos
+        if not self._hover_scheduled:
+            self._hover_scheduled = True
+            QTimer.singleShot(0, self._flush_hover)
+
+    def _flush_hover(self):
+        self._hover_scheduled = False
+        gpos, self._pending_hover_pos = self._pending_hover_pos, None
+        if gpos is None or self._heavy_animating or self._resizing:
+            return
+        self._update_cursor(self.mapFromGlobal(gpos))
 
     # -------------------------------------------------------------- mouse fallbacks
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton and not self._is_maximized:
             edges = self._calc_edges(e.position().toPoint())
-            if any(edges):
+            if edges:
                 self._resizing = True
                 self._resize_edges = edges
                 self._resize_pos = e.globalPosition().toPoint()
@@ -460,7 +583,7 @@ class FramelessWindow(QMainWindow):
     def mouseMoveEvent(self, e):
         if self._resizing:
             delta = e.globalPosition().toPoint() - self._resize_pos
-            self._perform_resize(delta)
+            self._queue_resize(delta)
             self._resize_pos = e.globalPosition().toPoint()
             e.accept(); return
         else:
@@ -472,9 +595,31 @@ class FramelessWindow(QMainWindow):
         super().mouseReleaseEvent(e)
 
     # -------------------------------------------------------------- resize impl
+    def _queue_resize(self, delta: QPoint):
+        # mouse de alta taxa manda centenas de MouseMove/s: acumula o delta e
+        # aplica uma vez por volta do event loop (e no máx. a cada RESIZE_MIN_MS)
+        self._pending_resize_delta += delta
+        if not self._resize_scheduled:
+            self._resize_scheduled = True
+            QTimer.singleShot(0, self._flush_resize)
+
+    def _flush_resize(self):
+        wait_ms = int((self._last_resize_flush + _Fx.RESIZE_MIN_MS / 1000.0 - monotonic()) * 1000)
+        if wait_ms > 0:
+            QTimer.singleShot(wait_ms, self._flush_resize)
+            return
+        self._resize_scheduled = False
+        delta, self._pending_resize_delta = self._pending_resize_delta, QPoint()
+        if delta.isNull():
+            return
+        self._last_resize_flush = monotonic()
+        self._perform_resize(delta)
+
     def _perform_resize(self, delta: QPoint):
         geo: QRect = self.geometry()
-        left, top, right, bottom = self._resize_edges
+        edges = self._resize_edges
+        left, top = edges & _EDGE_L, edges & _EDGE_T
+        right, bottom = edges & _EDGE_R, edges & _EDGE_B
         x, y, w, h = geo.x(), geo.y(), geo.width(), geo.height()
 
         if left:
@@ -501,13 +646,11 @@ class FramelessWindow(QMainWindow):
 
     # ================================================================ animações
     def _keep_anim(self, anim: QObject):
-        self._anim_refs.append(anim)
+        key = id(anim)
+        self._anim_refs[key] = anim
 
         def _cleanup():
-            try:
-                self._anim_refs.remove(anim)
-            except ValueError:
-                pass
+            self._anim_refs.pop(key, None)
         try:
             anim.finished.connect(_cleanup)  # type: ignore
         except Exception:
@@ -534,16 +677,35 @@ class FramelessWindow(QMainWindow):
         self._heavy_animating = False
 
     def _mk_geo_anim(self, start: QRect, end: QRect, dur: int, easing=QEasingCurve.OutCubic):
-        a = QPropertyAnimation(self, b"geometry")
+        # QVariantAnimation em vez de QPropertyAnimation("geometry"): o valor passa
+        # pelo setter coalescido, então ticks no mesmo ciclo (ou repetidos) não
+        # disparam setGeometry/layout extra
+        a = QVariantAnimation(self)
         a.setDuration(dur)
         a.setStartValue(start)
         a.setEndValue(end)
         a.setEasingCurve(easing)
+        a.valueChanged.connect(self._queue_anim_geometry)
+        # aplica o valor final já no finished (antes de minimizar/fechar etc.)
+        a.finished.connect(self._flush_anim_geometry)
         return a
 
+    def _queue_anim_geometry(self, rect: QRect):
+        self._pending_anim_geo = rect
+        if not self._anim_geo_scheduled:
+            self._anim_geo_scheduled = True
+            QTimer.singleShot(0, self._flush_anim_geometry)
+
+    def _flush_anim_geometry(self):
+        self._anim_geo_scheduled = False
+        rect, self._pending_anim_geo = self._pending_anim_geo, None
+        if rect is None or rect == self.geometry():
+            return
+        self.setGeometry(rect)
+
     def _animate_geometry(self, target: QRect, dur: int | None = None, easing=QEasingCurve.OutCubic):
         dur = self._geo_ms if dur is None else dur
-        if self._geo_anim and self._geo_anim.state() == QPropertyAnimation.Running:
+        if self._geo_anim and self._geo_anim.state() == QAbstractAnimation.Running:
             self._geo_anim.stop()
         self._begin_heavy_anim()
         self._geo_anim = self._mk_geo_anim(self.geometry(), target, dur, easing)
@@ -574,7 +736,7 @@ class FramelessWindow(QMainWindow):
         ec = QEasingCurve(curve_back); ec.setOvershoot(1.18)
         a2.setEasingCurve(ec)
 
-        if self._geo_anim and self._geo_anim.state() == QPropertyAnimation.Running:
+        if self._geo_anim and self._geo_anim.state() == QAbstractAnimation.Running:
             self._geo_anim.stop()
 
         seq = QSequentialAnimationGroup(self)
@@ -603,7 +765,7 @@ class FramelessWindow(QMainWindow):
 
     # ================================================================= ações
     def _stop_anims(self):
-        if self._geo_anim and self._geo_anim.state() == QPropertyAnimation.Running:
+        if self._geo_anim and self._geo_anim.state() == QAbstractAnimation.Running:
             self._geo_anim.stop()
         if self._fade_anim and self._fade_anim.state() == QPropertyAnimation.Running:
             self._fade_anim.stop()
@@ -666,7 +828,7 @@ class FramelessWindow(QMainWindow):
                 curve_back=QEasingCurve.OutBack
             )
             self._is_maximized = True
-            self.unsetCursor()  # em modo max não mostramos cursores de resize
+            self._set_edge_cursor(None)  # em modo max não mostramos cursores de resize
         else:
             # Restaura para a geometria anterior (ou fallback)
             target = self._normal_geometry if self._normal_geometry else QRect(
@@ -714,11 +876,7 @@ class FramelessWindow(QMainWindow):
         ny = g.center().y() - target_h // 2
         target = QRect(nx, ny, target_w, target_h)
 
-        geo = QPropertyAnimation(self, b"geometry")
-        geo.setDuration(max(180, self._geo_ms - 120))
-        geo.setStartValue(g)
-        geo.setEndValue(target)
-        geo.setEasingCurve(QEasingCurve.InBack)
+        geo = self._mk_geo_anim(g, target, max(180, self._geo_ms - 120), QEasingCurve.InBack)
 
         fade = QPropertyAnimation(self, b"windowOpacity")
         fade.setDuration(max(180, self._fade_ms))
@@ -793,12 +951,15 @@ class FramelessWindow(QMainWindow):
     def keyPressEvent(self, e):
         if e.key() == Qt.Key_Escape and self._resizing:
             self._resizing = False
+            self._pending_resize_delta = QPoint()
             e.accept(); return
         super().keyPressEvent(e)
 
     def resizeEvent(self, e):
+        size = e.size()
+        self._cached_w, self._cached_h = size.width(), size.height()
         if self._is_maximized:
-            self.unsetCursor()
+            self._set_edge_cursor(None)
         # Atualiza a máscara arredondada a cada resize (quando habilitada)
         self._apply_rounded_mask()
         super().resizeEvent(e)
@@ -1062,6 +1223,6 @@ class FramelessToastDialog(FramelessDialog):
 
     def eventFilter(self, obj: QObject, ev):
         # Evita maximizar por duplo-clique em diálogos
-        if obj in getattr(self, "_draggables", []) and ev.type() == QEvent.MouseButtonDblClick:
+        if ev.type() == QEvent.MouseButtonDblClick and id(obj) in self._draggables_ids:
             return True
         return super().eventFilter(obj, ev)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional, Union
 from datetime import datetime
 
 from PySide6.QtCore import Signal, Qt
@@ -24,8 +24,10 @@ class Router(QStackedWidget):
         super().__init__(parent)
         self.setObjectName("AppContentArea")
 
-        # Mapa de rotas -> QWidget
-        self._pages: Dict[str, QWidget] = {}
+        # Mapa de rotas -> QWidget (None = página lazy ainda não criada)
+        self._pages: Dict[str, Optional[QWidget]] = {}
+        # Factories das páginas lazy pendentes
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
 
         # Rota atual (path hierárquico)
         self._current_path: Optional[str] = None
@@ -38,17 +40,49 @@ class Router(QStackedWidget):
     # -------------------------------------------------------------------------
     # Registro
     # -------------------------------------------------------------------------
-    def register(self, path: str, widget: QWidget):
-        """Registra uma página por caminho (pode conter '/')."""
-        if not path or not isinstance(widget, QWidget):
+    def register(self, path: str, widget: Union[QWidget, Callable[[], QWidget]]):
+        """Registra uma página por caminho (pode conter '/').
+
+        Aceita o widget pronto ou uma factory sem argumentos; a factory só é
+        chamada na primeira navegação para a rota.
+        """
+        is_widget = isinstance(widget, QWidget)
+        if not path or not (is_widget or callable(widget)):
             raise ValueError("Rota inválida ou widget inválido.")
         if path in self._pages:
             # último vence — mas é útil avisar no console em dev
             print(f"[WARN] sobrescrevendo rota já registrada: {path}")
+        if not is_widget:
+            self._pages[path] = None
+            self._factories[path] = widget
+            return
+        self._factories.pop(path, None)
         wrapped = self._ensure_scroller(widget)
         self._pages[path] = wrapped
         self.addWidget(wrapped)
 
+    def _page_for(self, path: str) -> Optional[QWidget]:
+        """Widget (já embrulhado) da rota, criando a página lazy se preciso."""
+        target = self._pages.get(path)
+        if target is not None:
+            return target
+        factory = self._factories.get(path)
+        if factory is None:
+            return None
+        try:
+            widget = factory()
+        except Exception as e:  # noqa: BLE001
+            print(f"[ERRO] criação da página '{path}' falhou:", e)
+            return None
+        if not isinstance(widget, QWidget):
+            print(f"[ERRO] factory da rota '{path}' não retornou QWidget.")
+            return None
+        del self._factories[path]
+        target = self._ensure_scroller(widget)
+        self._pages[path] = target
+        self.addWidget(target)
+        return target
+
     # --- Scroll wrapper automático ---
     def _ensure_scroller(self, w: QWidget) -> QWidget:
         try:
@@ -106,7 +140,9 @@ class Router(QStackedWidget):
         if path not in self._pages:
             raise KeyError(f"Rota '{path}' não registrada.")
 
-        target = self._pages[path]
+        target = self._page_for(path)
+        if target is None:
+            return
 
         # Empilha rota anterior no back_stack (se houver e se for diferente)
         if self._current_path is not None and self._current_path != path:
@@ -162,9 +198,9 @@ class Router(QStackedWidget):
 
     def _navigate_without_push(self, path: str, params: dict):
         """Muda a página sem mexer no back/forward (uso interno)."""
-        if path not in self._pages:
+        target = self._page_for(path)
+        if target is None:
             return
-        target = self._pages[path]
         self.setCurrentWidget(target)
         self._current_path = path
 
@@ -188,3 +224,7 @@ class Router(QStackedWidget):
     def current_route(self) -> Optional[str]:
         """Retorna o path da rota atual (ou None)."""
         return self._current_path
+
+    def has_route(self, path: str) -> bool:
+        """True se há página registrada para o path."""
+        return path in self._pages
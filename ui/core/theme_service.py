@@ -26,9 +26,16 @@ class _QssDump:
 
     @staticmethod
     def from_dir(cache_dir: Path) -> "_QssDump":
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        # a pasta só é criada no primeiro dump (ensure_dir), não na construção
         return _QssDump(dir=cache_dir, last_applied=cache_dir / "last_applied.qss")
 
+    def ensure_dir(self) -> Path:
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        return self.last_applied
+
 
 # =============================================================================
 # ThemeService
@@ -456,7 +463,7 @@ class ThemeService(QObject):
             qss = render_qss_from_base(
                 self._base_qss,
                 tokens,
-                debug_dump_path=str(self._qss_dump.last_applied) if dump else None,
+                debug_dump_path=str(self._qss_dump.ensure_dir()) if dump else None,
             )
             if cache_key:
                 self._qss_cache[cache_key] = qss
@@ -1,10 +1,20 @@
 # ui/core/utils/factories.py
 
 from __future__ import annotations
+from functools import lru_cache
 import inspect
 
+@lru_cache(maxsize=None)
+def _factory_params(factory) -> frozenset[str]:
+    # inspect.signature é caro: um parse por factory distinta
+    return frozenset(inspect.signature(factory).parameters)
+
 def call_with_known_kwargs(factory, /, **deps):
     """Chama a factory apenas com kwargs que ela aceita (DIP)."""
-    params = inspect.signature(factory).parameters
+    try:
+        params = _factory_params(factory)
+    except TypeError:
+        # callable não-hashable: sem cache
+        params = inspect.signature(factory).parameters
     use = {k: v for k, v in deps.items() if k in params}
     return factory(**use)
@@ -1,6 +1,8 @@
 # ui/core/utils/paths.py
 
 from __future__ import annotations
+from functools import lru_cache
+import os
 from pathlib import Path
 from PySide6.QtGui import QIcon
 
@@ -8,5 +10,17 @@ def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
+@lru_cache(maxsize=32)
+def _load_icon(path: str, mtime_ns: int) -> QIcon:
+    # QIcon é implicitamente compartilhado no Qt: reusar a instância é seguro
+    return QIcon(path)
+
 def safe_icon(path: Path) -> QIcon | None:
-    return QIcon(str(path)) if path and path.exists() else None
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # chave inclui o mtime: trocar o arquivo em disco gera um QIcon novo
+    return _load_icon(str(path), st.st_mtime_ns)
@@ -4,13 +4,17 @@ from pathlib import Path
 from typing import Optional
 from PySide6.QtGui import QIcon
 
+from .paths import safe_icon
+
 class ResourceManager:
     """
     Gerenciador de recursos da aplicação seguindo o princípio da Responsabilidade Única (SRP).
     """
     def __init__(self, assets_dir: str | Path):
         self.assets_dir = Path(assets_dir)
-        self.cache_dir = self._ensure_dir(self.assets_dir / "cache")
+        # criada só no primeiro uso (get_cache_path): instanciar não toca no disco
+        self.cache_dir = self.assets_dir / "cache"
+        self._cache_dir_ready = False
         self.icons_dir = self.assets_dir / "icons"
         self.themes_dir = self.assets_dir / "themes"
         self.qss_dir = self.assets_dir / "qss"
@@ -35,8 +39,8 @@ class ResourceManager:
         if category:
             icon_path = icon_path / category
             
-        icon_file = icon_path / name
-        return QIcon(str(icon_file)) if icon_file.exists() else None
+        # QIcon compartilhado por (caminho, mtime): pedir de novo não redecodifica
+        return safe_icon(icon_path / name)
     
     def get_theme_path(self, theme_name: str) -> Path:
         """Retorna o caminho para um arquivo de tema."""
@@ -48,4 +52,7 @@ class ResourceManager:
     
     def get_cache_path(self, name: str) -> Path:
         """Retorna um caminho no diretório de cache."""
+        if not self._cache_dir_ready:
+            self._ensure_dir(self.cache_dir)
+            self._cache_dir_ready = True
         return self.cache_dir / name
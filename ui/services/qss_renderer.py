@@ -95,7 +95,7 @@ def load_base_qss(path: str | None) -> str:
         return Path(path).read_text(encoding="utf-8")
     return _FALLBACK_BASE
 
-def _normalize_vars(tokens: dict | None) -> dict:
+def normalize_vars(tokens: dict | None) -> dict:
     """Mescla tokens do tema com defaults + aliases, e cria derivados úteis."""
     vars_ = dict(_DEFAULTS)
     if isinstance(tokens, dict):
@@ -144,7 +144,7 @@ def render_qss_from_base(base_qss: str, tokens: dict, *, debug_dump_path: str |
       - Remove {#RRGGBB} e quaisquer {token} remanescentes;
       - Opcionalmente grava o QSS final em debug_dump_path.
     """
-    vars_ = _normalize_vars(tokens)
+    vars_ = normalize_vars(tokens)
 
     # Quando debug_dump_path for None usamos o cache leve para animações;
     # ele evita recomputar o QSS em cada frame e reduz drasticamente o trabalho.
@@ -12,7 +12,7 @@ from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPen, QBrush, QMouseEv
 from PySide6.QtWidgets import (
     QPushButton, QMessageBox, QGraphicsDropShadowEffect,
     QCheckBox, QComboBox, QLineEdit, QToolButton, QLabel,
-    QWidget, QScrollArea, QFrame, QVBoxLayout, QSlider, QSizePolicy
+    QWidget, QScrollArea, QFrame, QVBoxLayout, QSlider, QSizePolicy, QApplication
 )
 
 # ---------- autosize util ----------
@@ -487,9 +487,10 @@ class ExpandMoreButton(QWidget):
             self._h_anim.start()
         else:
             # FECHAR
-            self._panel.clearFocus()
-            for w in self._panel.findChildren(QWidget):
-                w.clearFocus()
+            # só o widget com foco importa: sem varrer todos os descendentes
+            fw = QApplication.focusWidget()
+            if fw is not None and (fw is self._panel or self._panel.isAncestorOf(fw)):
+                fw.clearFocus()
 
             # ponto inicial = altura atual visível
             start_h = max(0, self._wrapper.height())
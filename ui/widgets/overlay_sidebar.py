@@ -119,6 +119,18 @@ class OverlaySidePanel(QFrame):
         it.setData(Qt.UserRole, name)
         self.list.addItem(it)
 
+    def add_pages(self, pages):
+        """Adiciona vários (name, label) com um único repaint da lista."""
+        lst = self.list
+        lst.setUpdatesEnabled(False)
+        try:
+            for name, label in pages:
+                it = QListWidgetItem(label)
+                it.setData(Qt.UserRole, name)
+                lst.addItem(it)
+        finally:
+            lst.setUpdatesEnabled(True)
+
     def open(self, animate: bool = True):
         if self._expanded or self._in_anim:
             return
@@ -8,6 +8,8 @@ from PySide6.QtCore import Qt, Signal, QPoint, QSize, QTimeLine, QTimer
 from PySide6.QtGui import QPixmap, QIcon, QPainter
 from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QPushButton, QSizePolicy
 
+from ui.core.utils.paths import safe_icon
+
 
 # ---------- Widget de ícone com animação (cross-fade) à prova de HiDPI ----------
 
@@ -21,6 +23,9 @@ class IconWidget(QWidget):
         self._anim: Optional[QTimeLine] = None
         self._progress: float = 1.0  # 1.0 = ícone atual totalmente visível
         self._fade_duration_ms: int = 240  # mais suave; ajuste se quiser
+        # Pixmaps já rasterizados por (cacheKey do ícone, tamanho físico, dpr):
+        # o cross-fade repinta ~60x/s os dois ícones no mesmo tamanho
+        self._pm_cache: dict[tuple[int, int, float], QPixmap] = {}
 
         self.setObjectName("TitleBarAppIcon")
         self.setFixedSize(self._icon_size, self._icon_size)
@@ -38,9 +43,9 @@ class IconWidget(QWidget):
         if isinstance(icon, QPixmap):
             return QIcon(icon)
         s = str(icon)
-        p = Path(s)
-        if p.exists():
-            return QIcon(str(p))
+        cached = safe_icon(Path(s))  # arquivo: QIcon compartilhado por (caminho, mtime)
+        if cached is not None:
+            return cached
         tmp = QIcon(s)  # aceita também ":/recurso"
         return tmp if not tmp.isNull() else None
 
@@ -109,14 +114,22 @@ class IconWidget(QWidget):
         return self.sizeHint()
 
     def _pixmap_for(self, icon: QIcon, dpr: float) -> Optional[QPixmap]:
-        phys_w, phys_h = int(self._icon_size * dpr), int(self._icon_size * dpr)
-        pm = icon.pixmap(phys_w, phys_h)
+        phys = int(self._icon_size * dpr)
+        key = (icon.cacheKey(), phys, dpr)
+        pm = self._pm_cache.get(key)
+        if pm is not None:
+            return pm
+        pm = icon.pixmap(phys, phys)
         if pm.isNull():
             return None
         try:
             pm.setDevicePixelRatio(dpr)
         except Exception:
             pass
+        # só ícone atual/antigo (e poucos dprs) importam: limite pequeno basta
+        if len(self._pm_cache) >= 8:
+            self._pm_cache.clear()
+        self._pm_cache[key] = pm
         return pm
 
     # --------- Pintura (cross-fade) ---------
@@ -240,9 +253,9 @@ class TitleBar(QWidget):
 
         # Sinais
         self._btn_settings.clicked.connect(self.settingsRequested)
-        self.btn_min.clicked.connect(self.minimizeRequested.emit)
-        self.btn_max.clicked.connect(self.maximizeRestoreRequested.emit)
-        self.btn_close.clicked.connect(self.closeRequested.emit)
+        self.btn_min.clicked.connect(self.minimizeRequested)
+        self.btn_max.clicked.connect(self.maximizeRestoreRequested)
+        self.btn_close.clicked.connect(self.closeRequested)
 
         # Conecta ao windowIconChanged assim que possível
         QTimer.singleShot(0, self._hook_window_icon_signal)
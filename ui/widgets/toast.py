@@ -488,8 +488,8 @@ class ActionToast(QWidget):
         self._shell = ToastShell(parent, kind=kind)
         self._content = ToastContent(title, text, kind=kind, actions=actions, sticky=sticky, parent=self._shell)
         self._shell._content_lay.addWidget(self._content)
-        self._content.actionTriggered.connect(self.actionTriggered.emit)
-        self._content.cancelRequested.connect(self.cancelRequested.emit)
+        self._content.actionTriggered.connect(self.actionTriggered)
+        self._content.cancelRequested.connect(self.cancelRequested)
 
         # Centro: snapshot provider (para quando ocultar)
         entry_id = uuid.uuid4().hex
@@ -56,7 +56,7 @@ class TopBar(QWidget):
         f.setFamily("Segoe UI Symbol")
         self.btn_more.setFont(f)
         self.btn_more.setPopupMode(QToolButton.InstantPopup)
-        self.btn_more.clicked.connect(self.openNotificationsRequested.emit)
+        self.btn_more.clicked.connect(self.openNotificationsRequested)
 
         # Badge de não lidas
         self._badge = QLabel("0", self)